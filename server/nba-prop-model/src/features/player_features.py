@@ -5,7 +5,42 @@ Transforms raw game data into model-ready features
 from typing import Dict, List, Optional, Tuple
 import pandas as pd
 import numpy as np
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+
+from ..jit import njit, WARMUP_ENABLED
+
+
+@njit('float64[:](float64[:], int64, int64)', cache=True)
+def _shifted_rolling_sum(values, window, min_periods):
+    """
+    Rolling sum over the `window` values *before* each row.
+
+    Equivalent to pd.Series(values).shift(1).rolling(window, min_periods).sum():
+    NaNs are skipped, and rows with fewer than `min_periods` observations are NaN.
+    """
+    n = values.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    total = 0.0
+    count = 0
+    for i in range(n):
+        # Window for row i covers values[i - window : i]
+        if i > 0:
+            v = values[i - 1]
+            if not np.isnan(v):
+                total += v
+                count += 1
+        if i - window - 1 >= 0:
+            v = values[i - window - 1]
+            if not np.isnan(v):
+                total -= v
+                count -= 1
+        out[i] = total if count >= min_periods else np.nan
+    return out
+
+
+def warmup() -> None:
+    """Run each JIT kernel once on a tiny input to force specialization"""
+    _shifted_rolling_sum(np.zeros(4, dtype=np.float64), 2, 1)
 
 
 @dataclass
@@ -65,6 +100,49 @@ class PlayerFeatures:
     # Sample size
     games_played: int = 0
 
+    def to_array(self, dtype=np.float32) -> np.ndarray:
+        """
+        Pack the numeric features into a flat array ordered by FEATURE_NAMES
+
+        Missing career baselines become NaN.
+        """
+        return np.array(
+            [getattr(self, name) for name in FEATURE_NAMES],
+            dtype=dtype
+        )
+
+
+# Numeric feature layout used by to_array (identity fields excluded)
+FEATURE_NAMES: Tuple[str, ...] = tuple(
+    f.name for f in fields(PlayerFeatures)
+    if f.name not in ('player_id', 'player_name', 'team', 'position')
+)
+PlayerFeatures.FEATURE_NAMES = FEATURE_NAMES
+
+
+def stack_features(
+    features: List[PlayerFeatures],
+    dtype=np.float32
+) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """
+    Pack many players into one (n_players, n_features) matrix
+
+    Returns the feature matrix (columns ordered by FEATURE_NAMES) and the
+    identity columns as separate small arrays keyed by
+    'player_id', 'player_name', 'team' and 'position'.
+    """
+    matrix = np.empty((len(features), len(FEATURE_NAMES)), dtype=dtype)
+    for i, f in enumerate(features):
+        matrix[i] = [getattr(f, name) for name in FEATURE_NAMES]
+
+    meta = {
+        'player_id': np.array([f.player_id for f in features], dtype=np.int64),
+        'player_name': np.array([f.player_name for f in features], dtype=object),
+        'team': np.array([f.team for f in features], dtype=object),
+        'position': np.array([f.position for f in features], dtype=object),
+    }
+    return matrix, meta
+
 
 class PlayerFeatureEngineer:
     """Transforms raw game logs into features"""
@@ -195,13 +273,17 @@ class PlayerFeatureEngineer:
                     df[stat].shift(1).rolling(window, min_periods=max(3, window//2)).std()
                 )
         
-        # Per-minute rolling
+        # Per-minute rolling (MIN's rolling sum is shared by every stat)
+        min_roll = _shifted_rolling_sum(df['MIN'].to_numpy(np.float64), 10, 3)
+        has_minutes = min_roll > 0
         for stat in ['PTS', 'REB', 'AST', 'STL', 'BLK', 'FG3M']:
             if stat not in df.columns:
                 continue
-            df[f'{stat}_PER_MIN_L10'] = (
-                df[stat].shift(1).rolling(10, min_periods=3).sum() /
-                df['MIN'].shift(1).rolling(10, min_periods=3).sum()
+            stat_roll = _shifted_rolling_sum(df[stat].to_numpy(np.float64), 10, 3)
+            df[f'{stat}_PER_MIN_L10'] = np.divide(
+                stat_roll, min_roll,
+                out=np.full_like(stat_roll, np.nan),
+                where=has_minutes
             )
         
         return df
@@ -465,3 +547,7 @@ def calculate_matchup_features(
     adjustments['minutes_mult'] = situational_mult
     
     return adjustments
+
+
+if WARMUP_ENABLED:
+    warmup()
@@ -1,10 +1,44 @@
 
-from typing import Dict
+from typing import Dict, Tuple
+
+# Home court advantage
+# Role players shoot better at home. Stars are more consistent.
+# General adjustment: +2% production at home vs away
+HOME_FACTOR = 1.02
+AWAY_FACTOR = 0.98
+
+# Back-to-back (B2B)
+# Fatigue affects efficiency and potentially minutes
+# Typically -3% efficiency on B2B
+B2B_FACTOR = 0.97
+B2B_MINUTES_ADJUSTMENT = -1.0  # Maybe play slightly less on B2B
+
 
 class SituationalFactorEngineer:
     """
     Handle situational factors (B2B, Home/Away, Rest)
     """
+
+    # (efficiency_mult, minutes_adjustment) indexed by [is_home][is_b2b].
+    # Only four situations exist, so they are computed once at class creation.
+    _FACTORS: Tuple[Tuple[Tuple[float, float], ...], ...] = tuple(
+        tuple(
+            (
+                (HOME_FACTOR if is_home else AWAY_FACTOR) * (B2B_FACTOR if is_b2b else 1.0),
+                B2B_MINUTES_ADJUSTMENT if is_b2b else 0.0,
+            )
+            for is_b2b in (False, True)
+        )
+        for is_home in (False, True)
+    )
+
+    def get_situational_factors(self, is_home: bool, is_b2b: bool) -> Tuple[float, float]:
+        """
+        Return the cached (efficiency_mult, minutes_adjustment) pair
+
+        Allocation-free variant of get_situational_adjustments for slate loops.
+        """
+        return self._FACTORS[bool(is_home)][bool(is_b2b)]
     
     def get_situational_adjustments(
         self,
@@ -16,26 +50,13 @@ class SituationalFactorEngineer:
         """
         Calculate multipliers/additives for stats based on situation
         """
-        
-        # Home court advantage
-        # Role players shoot better at home. Stars are more consistent.
-        # General adjustment: +2% production at home vs away
-        home_factor = 1.02 if is_home else 0.98
-        
-        # Back-to-back (B2B)
-        # Fatigue affects efficiency and potentially minutes
-        # Typically -3% efficiency on B2B
-        b2b_factor = 0.97 if is_b2b else 1.0
-        
         # Rest days
         # Too much rest (rust) or good rest?
         # 1-2 days is optimal. 3+ is "rust" risk? 0 is fatigue.
         # Simplification: treat > 0 as normal.
-        
-        # Combined efficiency multiplier
-        efficiency_mult = home_factor * b2b_factor
+        efficiency_mult, minutes_adjustment = self.get_situational_factors(is_home, is_b2b)
         
         return {
             'efficiency_mult': efficiency_mult,
-            'minutes_adjustment': -1.0 if is_b2b else 0.0, # Maybe play slightly less on B2B
+            'minutes_adjustment': minutes_adjustment,
         }
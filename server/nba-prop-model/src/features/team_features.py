@@ -1,4 +1,3 @@
-
 import pandas as pd
 import numpy as np
 from typing import Dict, Optional
@@ -7,13 +6,37 @@ class TeamFeatureEngineer:
     """
     Engineer team-level features
     """
+
+    # Columns read by calculate_team_metrics_arr
+    ADVANCED_COLS = ('PACE', 'OFF_RATING', 'DEF_RATING')
+    BOX_COLS = ('FGA', 'TOV', 'FTA', 'MIN', 'PTS', 'AST', 'FGM')
     
     def calculate_team_metrics(self, team_id: int, game_log: pd.DataFrame) -> Dict:
         """
         Calculate metrics for a team based on their game log
+
+        Thin wrapper that extracts the needed columns once as a float64
+        array and delegates to calculate_team_metrics_arr.
         """
         if game_log.empty:
             return self._get_default_metrics()
+
+        cols = [c for c in self.ADVANCED_COLS + self.BOX_COLS if c in game_log.columns]
+        arr = game_log[cols].to_numpy(np.float64, copy=False)
+        col_idx = {c: i for i, c in enumerate(cols)}
+
+        return self.calculate_team_metrics_arr(arr, col_idx)
+
+    def calculate_team_metrics_arr(self, arr: np.ndarray, col_idx: Dict[str, int]) -> Dict:
+        """
+        Calculate team metrics from a preconverted (N, k) float64 array
+
+        Args:
+            arr: Game log values, one row per game
+            col_idx: Mapping of column name -> column index in arr
+        """
+        if arr.shape[0] == 0:
+            return self._get_default_metrics()
             
         # Calculate possessions (approximate)
         # Poss = 0.5 * ((Tm FGA + 0.4 * Tm FTA - 1.07 * (Tm ORB / (Tm ORB + Opp DRB)) * (Tm FGA - Tm FG) + Tm TOV) 
@@ -21,34 +44,36 @@ class TeamFeatureEngineer:
         # For simplicity in this version, we'll use a simpler pace estimate if advanced stats aren't present
         
         # Check if we have advanced stats columns
-        has_adv = 'PACE' in game_log.columns
+        has_adv = 'PACE' in col_idx
         
         if has_adv:
-            pace = game_log['PACE'].mean()
-            off_rating = game_log['OFF_RATING'].mean()
-            def_rating = game_log['DEF_RATING'].mean()
+            pace = np.nanmean(arr[:, col_idx['PACE']])
+            off_rating = np.nanmean(arr[:, col_idx['OFF_RATING']])
+            def_rating = np.nanmean(arr[:, col_idx['DEF_RATING']])
         else:
             # Fallback to simple estimates or generic averages
             # Estimate pace from FGA + TOV + 0.44 * FTA
             possessions = (
-                game_log['FGA'] + 
-                game_log['TOV'] + 
-                0.44 * game_log['FTA']
+                arr[:, col_idx['FGA']] +
+                arr[:, col_idx['TOV']] +
+                0.44 * arr[:, col_idx['FTA']]
             )
-            minutes = game_log['MIN'] / 5  # MIN is total player minutes usually ~240
-            pace = (possessions / minutes) * 48
-            pace = pace.mean()
+            minutes = arr[:, col_idx['MIN']] / 5  # MIN is total player minutes usually ~240
+            with np.errstate(divide='ignore', invalid='ignore'):
+                pace = np.nanmean((possessions / minutes) * 48)
             
             # Approximate ratings
-            pts = game_log['PTS'].mean()
+            pts = np.nanmean(arr[:, col_idx['PTS']])
             off_rating = (pts / pace) * 100 if pace > 0 else 110.0
             def_rating = 110.0 # Without opponent score in player logs, hard to calc def rating
+
+        fgm_total = np.nansum(arr[:, col_idx['FGM']])
             
         return {
             'team_pace': float(pace),
             'team_off_rating': float(off_rating),
             'team_def_rating': float(def_rating),
-            'team_ast_pct': float(game_log['AST'].sum() / game_log['FGM'].sum()) if game_log['FGM'].sum() > 0 else 0.6,
+            'team_ast_pct': float(np.nansum(arr[:, col_idx['AST']]) / fgm_total) if fgm_total > 0 else 0.6,
             'team_orb_pct': 0.25, # Placeholder/Default
         }
 
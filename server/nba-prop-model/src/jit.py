@@ -0,0 +1,32 @@
+"""
+Optional Numba JIT support
+
+Kernels are declared with an explicit signature and ``cache=True`` so
+they are compiled eagerly at import time and the machine code is reused
+across processes. When numba is not installed, ``njit`` is a no-op and
+the kernels run as plain Python.
+
+Set ``JIT_WARMUP=1`` to have modules exercise their kernels on a tiny
+input at import time (loads the on-disk cache before the first request).
+"""
+
+import os
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback decorator: return the function unchanged"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+
+WARMUP_ENABLED = os.environ.get('JIT_WARMUP', '') == '1'
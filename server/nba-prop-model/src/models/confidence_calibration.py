@@ -8,10 +8,81 @@ Uses isotonic regression and Platt scaling to correct systematic
 over/under-confidence in the model's probability estimates.
 """
 
+import math
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
+import logging
 import numpy as np
 from dataclasses import dataclass, field
 
+from ..jit import njit
+
+logger = logging.getLogger(__name__)
+
+# Sklearn imports with fallback
+try:
+    from sklearn.linear_model import LogisticRegression
+    HAS_SKLEARN = True
+except ImportError:
+    HAS_SKLEARN = False
+    logger.info("sklearn not available — Platt scaling will use gradient descent")
+
+
+@njit('float64[:](float64[:])', cache=True, fastmath=True)
+def _pava_kernel(y):
+    """
+    Pooled PAVA: single forward pass over a stack of (sum, count) blocks.
+
+    Each value is pushed as its own block, then merged with the previous
+    block while the previous block's mean is larger. O(n) overall.
+    """
+    n = y.shape[0]
+    sums = np.empty(n, dtype=np.float64)
+    counts = np.empty(n, dtype=np.int64)
+    top = -1
+
+    for i in range(n):
+        top += 1
+        sums[top] = y[i]
+        counts[top] = 1
+        while top >= 1 and sums[top - 1] * counts[top] > sums[top] * counts[top - 1]:
+            sums[top - 1] += sums[top]
+            counts[top - 1] += counts[top]
+            top -= 1
+
+    # Expand blocks back to original size
+    out = np.empty(n, dtype=np.float64)
+    idx = 0
+    for k in range(top + 1):
+        mean = sums[k] / counts[k]
+        for _ in range(counts[k]):
+            out[idx] = mean
+            idx += 1
+    return out
+
+
+@njit('UniTuple(float64, 2)(float64[:], float64[:], int64, float64)', cache=True, fastmath=True)
+def _fit_logistic_kernel(logits, outcomes, max_iter, lr):
+    """Gradient descent for calibrated = sigmoid(a * logit + b)."""
+    n = logits.shape[0]
+    a = 1.0
+    b = 0.0
+
+    for _ in range(max_iter):
+        grad_a = 0.0
+        grad_b = 0.0
+        for i in range(n):
+            z = a * logits[i] + b
+            z = -20.0 if z < -20.0 else (20.0 if z > 20.0 else z)
+            error = 1.0 / (1.0 + np.exp(-z)) - outcomes[i]
+            grad_a += error * logits[i]
+            grad_b += error
+
+        a -= lr * grad_a / n
+        b -= lr * grad_b / n
+
+    return a, b
+
 
 @dataclass
 class CalibrationMetrics:
@@ -53,14 +124,35 @@ class ConfidenceCalibrator:
     # Default calibration bins
     N_BINS = 10
 
+    # Platt (a, b) within this distance of (1, 0) is treated as the identity
+    PLATT_IDENTITY_TOL = 1e-3
+
+    # Initial capacity of the per-stat prediction history buffers
+    HISTORY_CAPACITY = 128
+
+    # calibrate() memoization: entries kept, and decimals the input is rounded to
+    CACHE_SIZE = 4096
+    CACHE_DECIMALS = 3
+
     def __init__(self):
         """Initialize calibrator."""
         # Platt scaling parameters per stat type
         self._platt_params: Dict[str, Tuple[float, float]] = {}
-        # Isotonic regression lookup per stat type
-        self._isotonic_maps: Dict[str, Dict[float, float]] = {}
-        # Track predictions for online calibration
-        self._prediction_history: Dict[str, List[Tuple[float, bool]]] = {}
+        # True when the fitted Platt transform is (numerically) the identity
+        self._platt_is_identity: Dict[str, bool] = {}
+        # Isotonic regression lookup per stat type: (raw_sorted, cal_sorted)
+        self._isotonic_maps: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        # Track predictions for online calibration: (probs_buf, outcomes_buf, length)
+        # Buffers grow by doubling; only the first `length` entries are valid
+        self._prediction_history: Dict[str, Tuple[np.ndarray, np.ndarray, int]] = {}
+        # Refit counter per stat type; part of the calibrate cache key so
+        # refitting invalidates stale entries
+        self._versions: Dict[str, int] = {}
+        # Memoized (calibrated_prob, method) keyed by (stat_type, rounded prob, version)
+        self._calibrate_cached = lru_cache(maxsize=self.CACHE_SIZE)(self._calibrate_uncached)
+        # One-slot cache for back-to-back identical lookups
+        self._last_key: Optional[Tuple[str, float, int]] = None
+        self._last_value: Optional[Tuple[float, str]] = None
 
     def fit_platt_scaling(
         self,
@@ -84,14 +176,24 @@ class ConfidenceCalibrator:
         # Clip probabilities to avoid log(0)
         probs = np.clip(predicted_probs, 0.01, 0.99)
 
-        # Convert to logit space
-        logits = np.log(probs / (1 - probs))
+        # Convert to logit space (log(p) - log1p(-p) is stable near 0 and 1)
+        logits = np.log(probs) - np.log1p(-probs)
 
         # Fit simple logistic regression: a * logit + b
-        # Using Newton's method for 2 parameters
-        a, b = self._fit_logistic(logits, actual_outcomes)
+        outcomes = np.asarray(actual_outcomes).astype(int)
+        if HAS_SKLEARN and np.unique(outcomes).size == 2:
+            # Effectively unregularized L-BFGS fit
+            clf = LogisticRegression(C=1e12, solver='lbfgs', fit_intercept=True)
+            clf.fit(logits.reshape(-1, 1), outcomes)
+            a, b = float(clf.coef_[0, 0]), float(clf.intercept_[0])
+        else:
+            a, b = self._fit_logistic(logits, actual_outcomes)
 
         self._platt_params[stat_type] = (a, b)
+        self._platt_is_identity[stat_type] = (
+            abs(a - 1.0) < self.PLATT_IDENTITY_TOL and abs(b) < self.PLATT_IDENTITY_TOL
+        )
+        self._versions[stat_type] = self._versions.get(stat_type, 0) + 1
 
     def fit_isotonic_regression(
         self,
@@ -121,15 +223,14 @@ class ConfidenceCalibrator:
         # Pool-adjacent-violators algorithm (PAVA)
         calibrated = self._pool_adjacent_violators(sorted_outcomes)
 
-        # Create lookup map (bin to calibrated probability)
-        iso_map = {}
+        # Create lookup arrays (~100 knots, already sorted by raw probability)
         n = len(sorted_probs)
-        for i in range(0, n, max(1, n // 100)):
-            raw = float(sorted_probs[i])
-            cal = float(calibrated[i])
-            iso_map[raw] = cal
+        step = max(1, n // 100)
+        raw_arr = np.ascontiguousarray(sorted_probs[::step], dtype=np.float64)
+        cal_arr = np.ascontiguousarray(calibrated[::step], dtype=np.float64)
 
-        self._isotonic_maps[stat_type] = iso_map
+        self._isotonic_maps[stat_type] = (raw_arr, cal_arr)
+        self._versions[stat_type] = self._versions.get(stat_type, 0) + 1
 
     def calibrate(
         self,
@@ -150,33 +251,85 @@ class ConfidenceCalibrator:
         """
         raw_probability = max(0.01, min(0.99, raw_probability))
 
-        # Try isotonic first
-        if stat_type in self._isotonic_maps:
-            cal_prob = self._interpolate_isotonic(raw_probability, stat_type)
+        version = self._versions.get(stat_type)
+        if version is None:
+            # No calibration available
             return CalibrationResult(
                 raw_probability=raw_probability,
-                calibrated_probability=cal_prob,
-                calibration_method='isotonic',
-                adjustment=cal_prob - raw_probability,
+                calibrated_probability=raw_probability,
+                calibration_method='none',
+                adjustment=0.0,
             )
 
-        # Try Platt scaling
-        if stat_type in self._platt_params:
-            cal_prob = self._apply_platt(raw_probability, stat_type)
-            return CalibrationResult(
-                raw_probability=raw_probability,
-                calibrated_probability=cal_prob,
-                calibration_method='platt',
-                adjustment=cal_prob - raw_probability,
-            )
+        key = (stat_type, float(np.round(raw_probability, self.CACHE_DECIMALS)), version)
+        if key == self._last_key:
+            cal_prob, method = self._last_value
+        else:
+            cal_prob, method = self._calibrate_cached(*key)
+            self._last_key = key
+            self._last_value = (cal_prob, method)
 
-        # No calibration available
         return CalibrationResult(
             raw_probability=raw_probability,
-            calibrated_probability=raw_probability,
-            calibration_method='none',
-            adjustment=0.0,
+            calibrated_probability=cal_prob,
+            calibration_method=method,
+            adjustment=cal_prob - raw_probability,
+        )
+
+    def calibrate_many(
+        self,
+        probs: np.ndarray,
+        stat_type: str,
+    ) -> np.ndarray:
+        """
+        Calibrate an array of probabilities in one pass.
+
+        Goes through the same rounded, memoized path as calibrate(), so
+        calibrate_many([p])[0] == calibrate(p).calibrated_probability.
+        Rounded to CACHE_DECIMALS there are at most ~1000 distinct inputs,
+        so each distinct value is calibrated once and gathered back.
+
+        Args:
+            probs: Array of raw model probabilities
+            stat_type: Stat type
+
+        Returns:
+            Array of calibrated probabilities (same shape as probs)
+        """
+        probs = np.clip(np.asarray(probs, dtype=np.float64), 0.01, 0.99)
+
+        version = self._versions.get(stat_type)
+        if version is None:
+            # No calibration available
+            return probs
+
+        keys, inverse = np.unique(np.round(probs, self.CACHE_DECIMALS), return_inverse=True)
+        table = np.array(
+            [self._calibrate_cached(stat_type, key, version)[0] for key in keys.tolist()],
+            dtype=np.float64,
         )
+        return table[inverse].reshape(probs.shape)
+
+    def _calibrate_uncached(
+        self,
+        stat_type: str,
+        raw_probability: float,
+        version: int,
+    ) -> Tuple[float, str]:
+        """
+        Apply the best available calibration (memoized via _calibrate_cached).
+
+        `version` is unused here; it only makes refits produce new cache keys.
+        """
+        # Try isotonic first
+        if stat_type in self._isotonic_maps:
+            return self._interpolate_isotonic(raw_probability, stat_type), 'isotonic'
+
+        # Try Platt scaling
+        if stat_type in self._platt_params:
+            return self._apply_platt(raw_probability, stat_type), 'platt'
+
+        return raw_probability, 'none'
 
     def record_prediction(
         self,
@@ -186,16 +339,28 @@ class ConfidenceCalibrator:
     ):
         """Record a prediction for online calibration tracking."""
         if stat_type not in self._prediction_history:
-            self._prediction_history[stat_type] = []
-        self._prediction_history[stat_type].append((predicted_prob, actual_hit))
+            self._prediction_history[stat_type] = (
+                np.empty(self.HISTORY_CAPACITY, dtype=np.float64),
+                np.empty(self.HISTORY_CAPACITY, dtype=np.float64),
+                0,
+            )
+        probs_buf, outcomes_buf, length = self._prediction_history[stat_type]
+
+        if length == len(probs_buf):
+            probs_buf = np.resize(probs_buf, 2 * length)
+            outcomes_buf = np.resize(outcomes_buf, 2 * length)
+
+        probs_buf[length] = predicted_prob
+        outcomes_buf[length] = 1.0 if actual_hit else 0.0
+        length += 1
+        self._prediction_history[stat_type] = (probs_buf, outcomes_buf, length)
 
         # Auto-refit when enough data accumulates
-        history = self._prediction_history[stat_type]
-        if len(history) % 100 == 0 and len(history) >= self.MIN_PREDICTIONS_PLATT:
-            probs = np.array([h[0] for h in history])
-            outcomes = np.array([1.0 if h[1] else 0.0 for h in history])
+        if length % 100 == 0 and length >= self.MIN_PREDICTIONS_PLATT:
+            probs = probs_buf[:length]
+            outcomes = outcomes_buf[:length]
             self.fit_platt_scaling(probs, outcomes, stat_type)
-            if len(history) >= self.MIN_PREDICTIONS_ISOTONIC:
+            if length >= self.MIN_PREDICTIONS_ISOTONIC:
                 self.fit_isotonic_regression(probs, outcomes, stat_type)
 
     def evaluate_calibration(
@@ -218,41 +383,42 @@ class ConfidenceCalibrator:
         n_bins = n_bins or self.N_BINS
         bin_edges = np.linspace(0, 1, n_bins + 1)
 
-        bin_true_probs = []
-        bin_predicted_probs = []
-        bin_counts = []
-
-        for i in range(n_bins):
-            mask = (predicted_probs >= bin_edges[i]) & (predicted_probs < bin_edges[i + 1])
-            if mask.sum() == 0:
-                bin_true_probs.append(0.0)
-                bin_predicted_probs.append((bin_edges[i] + bin_edges[i + 1]) / 2)
-                bin_counts.append(0)
-                continue
-
-            bin_true_probs.append(float(actual_outcomes[mask].mean()))
-            bin_predicted_probs.append(float(predicted_probs[mask].mean()))
-            bin_counts.append(int(mask.sum()))
+        predicted_probs = np.asarray(predicted_probs, dtype=np.float64)
+        actual_outcomes = np.asarray(actual_outcomes, dtype=np.float64)
+
+        # Assign every prediction to a half-open bin [lo, hi) in one pass, then
+        # aggregate per bin; values outside [0, 1) (including p == 1.0) fall
+        # in no bin
+        idx = np.digitize(predicted_probs, bin_edges) - 1
+        in_bin = (idx >= 0) & (idx < n_bins)
+        idx = idx[in_bin]
+        counts = np.bincount(idx, minlength=n_bins)
+        sum_pred = np.bincount(idx, weights=predicted_probs[in_bin], minlength=n_bins)
+        sum_true = np.bincount(idx, weights=actual_outcomes[in_bin], minlength=n_bins)
+
+        nonempty = counts > 0
+        denom = np.maximum(counts, 1)
+        bin_true_probs = np.where(nonempty, sum_true / denom, 0.0)
+        # Empty bins report their midpoint as the predicted probability
+        bin_predicted_probs = np.where(
+            nonempty, sum_pred / denom, (bin_edges[:-1] + bin_edges[1:]) / 2
+        )
 
         # Brier score
         brier = float(np.mean((predicted_probs - actual_outcomes) ** 2))
 
-        # Expected Calibration Error
+        # Expected / maximum calibration error over non-empty bins
         total = len(predicted_probs)
-        ece = 0.0
-        mce = 0.0
-        for i in range(n_bins):
-            if bin_counts[i] > 0:
-                gap = abs(bin_true_probs[i] - bin_predicted_probs[i])
-                ece += (bin_counts[i] / total) * gap
-                mce = max(mce, gap)
+        gaps = np.abs(bin_true_probs - bin_predicted_probs)[nonempty]
+        ece = float(np.sum(counts[nonempty] / total * gaps)) if total else 0.0
+        mce = float(gaps.max()) if gaps.size else 0.0
 
         return CalibrationMetrics(
             n_bins=n_bins,
             bin_edges=list(bin_edges),
-            bin_true_probs=bin_true_probs,
-            bin_predicted_probs=bin_predicted_probs,
-            bin_counts=bin_counts,
+            bin_true_probs=bin_true_probs.tolist(),
+            bin_predicted_probs=bin_predicted_probs.tolist(),
+            bin_counts=counts.tolist(),
             brier_score=brier,
             expected_calibration_error=ece,
             max_calibration_error=mce,
@@ -265,93 +431,49 @@ class ConfidenceCalibrator:
         max_iter: int = 100,
         lr: float = 0.01,
     ) -> Tuple[float, float]:
-        """Fit logistic regression using gradient descent."""
-        a = 1.0
-        b = 0.0
-
-        for _ in range(max_iter):
-            z = a * logits + b
-            preds = 1.0 / (1.0 + np.exp(-np.clip(z, -20, 20)))
-
-            # Gradients
-            error = preds - outcomes
-            grad_a = np.mean(error * logits)
-            grad_b = np.mean(error)
-
-            a -= lr * grad_a
-            b -= lr * grad_b
-
+        """Fit logistic regression using gradient descent (no-sklearn fallback)."""
+        a, b = _fit_logistic_kernel(
+            np.ascontiguousarray(logits, dtype=np.float64),
+            np.ascontiguousarray(outcomes, dtype=np.float64),
+            max_iter,
+            lr,
+        )
         return float(a), float(b)
 
     def _apply_platt(self, raw_prob: float, stat_type: str) -> float:
         """Apply Platt scaling to a probability."""
+        raw_prob = max(0.01, min(0.99, raw_prob))
+        if self._platt_is_identity.get(stat_type, False):
+            return raw_prob
+
         a, b = self._platt_params[stat_type]
 
-        # Convert to logit
-        raw_prob = max(0.01, min(0.99, raw_prob))
-        logit = np.log(raw_prob / (1 - raw_prob))
+        # Convert to logit (scalar math; avoids NumPy dispatch on 0-d values)
+        logit = math.log(raw_prob / (1 - raw_prob))
 
         # Apply transformation
         z = a * logit + b
-        calibrated = 1.0 / (1.0 + np.exp(-np.clip(z, -20, 20)))
-
-        return float(calibrated)
+        z = -20.0 if z < -20.0 else (20.0 if z > 20.0 else z)
+        return 1.0 / (1.0 + math.exp(-z))
 
     def _interpolate_isotonic(self, raw_prob: float, stat_type: str) -> float:
         """Interpolate isotonic calibration map."""
-        iso_map = self._isotonic_maps[stat_type]
-
-        # Find nearest keys
-        keys = sorted(iso_map.keys())
-        if not keys:
+        raw_arr, cal_arr = self._isotonic_maps[stat_type]
+        if len(raw_arr) == 0:
             return raw_prob
 
-        # Binary search for closest keys
-        if raw_prob <= keys[0]:
-            return iso_map[keys[0]]
-        if raw_prob >= keys[-1]:
-            return iso_map[keys[-1]]
-
-        # Linear interpolation between nearest keys
-        for i in range(len(keys) - 1):
-            if keys[i] <= raw_prob <= keys[i + 1]:
-                weight = (raw_prob - keys[i]) / (keys[i + 1] - keys[i]) if keys[i + 1] != keys[i] else 0.5
-                return iso_map[keys[i]] * (1 - weight) + iso_map[keys[i + 1]] * weight
+        # Binary search for the bracketing knots: raw_arr[i-1] < raw_prob <= raw_arr[i]
+        i = int(np.searchsorted(raw_arr, raw_prob))
+        if i == 0:
+            return float(cal_arr[0])
+        if i == len(raw_arr):
+            return float(cal_arr[-1])
 
-        return raw_prob
+        # Linear interpolation between nearest knots
+        lo, hi = raw_arr[i - 1], raw_arr[i]
+        weight = (raw_prob - lo) / (hi - lo)
+        return float(cal_arr[i - 1] * (1 - weight) + cal_arr[i] * weight)
 
     def _pool_adjacent_violators(self, y: np.ndarray) -> np.ndarray:
         """Pool Adjacent Violators Algorithm for isotonic regression."""
-        n = len(y)
-        result = y.copy().astype(float)
-        block_starts = list(range(n))
-        block_sizes = [1] * n
-
-        i = 0
-        while i < n - 1:
-            if result[i] > result[i + 1]:
-                # Merge blocks
-                total = result[i] * block_sizes[i] + result[i + 1] * block_sizes[i + 1]
-                new_size = block_sizes[i] + block_sizes[i + 1]
-                result[i] = total / new_size
-                block_sizes[i] = new_size
-
-                # Remove next block
-                result = np.delete(result, i + 1)
-                block_sizes.pop(i + 1)
-                n -= 1
-
-                # Check backward
-                if i > 0:
-                    i -= 1
-            else:
-                i += 1
-
-        # Expand blocks back to original size
-        expanded = np.zeros(len(y))
-        idx = 0
-        for val, size in zip(result, block_sizes):
-            expanded[idx:idx + size] = val
-            idx += size
-
-        return expanded
+        return _pava_kernel(np.ascontiguousarray(y, dtype=np.float64))
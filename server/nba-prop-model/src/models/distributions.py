@@ -2,16 +2,69 @@
 Distribution Modeling for NBA Props
 Proper probability distributions for each stat type with correlation structure
 """
+import math
 from typing import Dict, List, Optional, Tuple, Union
 import numpy as np
 import pandas as pd
 from scipy import stats
 from scipy.stats import norm, poisson, nbinom
-from dataclasses import dataclass
+from scipy.special import ndtr
+from dataclasses import dataclass, field
 from functools import lru_cache
 
+from ..jit import njit, HAS_NUMBA
 
-@dataclass
+
+@njit('float64[:, :](float64[:, :])', cache=True)
+def _standardized_corr_kernel(x):
+    """
+    Pearson correlation of the columns of x as (1/n) Z.T @ Z, Z standardized.
+
+    Constant columns have no defined correlation and come out NaN (including
+    the diagonal), as in pandas. Requires at least one row.
+    """
+    n, k = x.shape
+    z = np.empty((n, k))
+    valid = np.empty(k, dtype=np.bool_)
+    for j in range(k):
+        mean = 0.0
+        for i in range(n):
+            mean += x[i, j]
+        mean /= n
+        var = 0.0
+        for i in range(n):
+            d = x[i, j] - mean
+            z[i, j] = d
+            var += d * d
+        valid[j] = var > 0.0
+        if valid[j]:
+            inv_std = 1.0 / np.sqrt(var / n)
+            for i in range(n):
+                z[i, j] *= inv_std
+    out = np.empty((k, k))
+    for a in range(k):
+        out[a, a] = 1.0 if valid[a] else np.nan
+        for b in range(a + 1, k):
+            if valid[a] and valid[b]:
+                acc = 0.0
+                for i in range(n):
+                    acc += z[i, a] * z[i, b]
+                out[a, b] = acc / n
+            else:
+                out[a, b] = np.nan
+            out[b, a] = out[a, b]
+    return out
+
+
+# Largest double below 1; copula uniforms are capped here before a PPF
+_MAX_UNIFORM = np.nextafter(1.0, 0.0)
+
+# Percentiles exposed by StatProjection.percentiles
+PERCENTILE_KEYS = (10, 25, 50, 75, 90)
+PERCENTILE_QUANTILES = np.array(PERCENTILE_KEYS) / 100
+
+
+@dataclass(slots=True)
 class StatProjection:
     """Projection for a single stat"""
     stat_name: str
@@ -22,38 +75,54 @@ class StatProjection:
     # Distribution parameters
     params: Dict  # e.g., {"loc": 25.5, "scale": 7.2} for normal
     
-    # Derived probabilities
-    percentiles: Dict[int, float] = None  # {10: x, 25: x, 50: x, 75: x, 90: x}
+    # Frozen scipy distribution, built once in __post_init__
+    _rv: object = field(default=None, init=False, repr=False, compare=False)
+    # Lazily filled by the percentiles property
+    _percentiles: Optional[Dict[int, float]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.distribution == "poisson":
+            self._rv = poisson(self.mean)
+        elif self.distribution == "negbinom":
+            self._rv = nbinom(self.params.get('r', 5), self.params.get('p', 0.5))
+        else:
+            # "normal", and fallback to normal for unknown types
+            self._rv = norm(self.mean, self.std)
+
+    @property
+    def percentiles(self) -> Dict[int, float]:
+        """Derived percentiles {10: x, 25: x, 50: x, 75: x, 90: x}, computed on first access"""
+        if self._percentiles is None:
+            values = self._rv.ppf(PERCENTILE_QUANTILES)
+            self._percentiles = {k: float(v) for k, v in zip(PERCENTILE_KEYS, values)}
+        return self._percentiles
     
     def prob_over(self, line: float) -> float:
         """Calculate P(stat > line)"""
-        if self.distribution == "normal":
-            return 1 - norm.cdf(line, self.mean, self.std)
-        elif self.distribution == "poisson":
-            # For discrete: P(X > line) = 1 - P(X <= floor(line))
-            return 1 - poisson.cdf(int(line), self.mean)
-        elif self.distribution == "negbinom":
-            r, p = self.params.get('r', 5), self.params.get('p', 0.5)
-            return 1 - nbinom.cdf(int(line), r, p)
-        else:
-            # Fallback to normal
-            return 1 - norm.cdf(line, self.mean, self.std)
+        if self.distribution in ("poisson", "negbinom"):
+            # For discrete: P(X > line) = P(X > floor(line))
+            return self._rv.sf(int(line))
+        return self._rv.sf(line)
+    
+    def prob_over_vec(self, lines: np.ndarray) -> np.ndarray:
+        """Calculate P(stat > line) for an array of lines in one scipy call"""
+        lines = np.asarray(lines, dtype=np.float64)
+        if self.distribution in ("poisson", "negbinom"):
+            # Truncate like int(line) in prob_over
+            return self._rv.sf(np.trunc(lines))
+        return self._rv.sf(lines)
     
     def prob_under(self, line: float) -> float:
         """Calculate P(stat < line)"""
-        return 1 - self.prob_over(line)
+        if self.distribution in ("poisson", "negbinom"):
+            # For discrete: P(X < line) = P(X <= ceil(line) - 1), so a push
+            # (X == line on whole-number lines) counts as neither side
+            return self._rv.cdf(math.ceil(line) - 1)
+        return self._rv.cdf(line)
     
     def sample(self, n: int = 10000) -> np.ndarray:
         """Generate samples from distribution"""
-        if self.distribution == "normal":
-            return norm.rvs(self.mean, self.std, size=n)
-        elif self.distribution == "poisson":
-            return poisson.rvs(self.mean, size=n)
-        elif self.distribution == "negbinom":
-            r, p = self.params.get('r', 5), self.params.get('p', 0.5)
-            return nbinom.rvs(r, p, size=n)
-        else:
-            return norm.rvs(self.mean, self.std, size=n)
+        return self._rv.rvs(size=n)
 
 
 @dataclass
@@ -82,6 +151,12 @@ class JointProjection:
     # Combination props
     pts_reb_ast: Optional[StatProjection] = None
 
+    # float32 factor of correlation_matrix (L @ L.T), reused by every simulation
+    _chol: np.ndarray = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._chol = correlation_factor(self.correlation_matrix).astype(np.float32)
+
 
 class DistributionModeler:
     """
@@ -105,10 +180,13 @@ class DistributionModeler:
     def __init__(
         self,
         n_simulations: int = 10000,
-        use_empirical_correlations: bool = True
+        use_empirical_correlations: bool = True,
+        seed: Optional[int] = None
     ):
         self.n_simulations = n_simulations
         self.use_empirical_correlations = use_empirical_correlations
+        # PCG64 generator owned by this modeler (seed for reproducible sims)
+        self._rng = np.random.default_rng(seed)
         
     def fit_stat_distribution(
         self,
@@ -171,14 +249,7 @@ class DistributionModeler:
             mean=mean,
             std=std,
             distribution="normal",
-            params={"loc": mean, "scale": std},
-            percentiles={
-                10: norm.ppf(0.10, mean, std),
-                25: norm.ppf(0.25, mean, std),
-                50: norm.ppf(0.50, mean, std),
-                75: norm.ppf(0.75, mean, std),
-                90: norm.ppf(0.90, mean, std),
-            }
+            params={"loc": mean, "scale": std}
         )
     
     def _fit_poisson(self, values: np.ndarray, stat_type: str) -> StatProjection:
@@ -191,14 +262,7 @@ class DistributionModeler:
             mean=mean,
             std=std,
             distribution="poisson",
-            params={"mu": mean},
-            percentiles={
-                10: poisson.ppf(0.10, mean),
-                25: poisson.ppf(0.25, mean),
-                50: poisson.ppf(0.50, mean),
-                75: poisson.ppf(0.75, mean),
-                90: poisson.ppf(0.90, mean),
-            }
+            params={"mu": mean}
         )
     
     def _fit_negative_binomial(self, values: np.ndarray, stat_type: str) -> StatProjection:
@@ -226,14 +290,7 @@ class DistributionModeler:
             mean=mean,
             std=std,
             distribution="negbinom",
-            params={"r": r, "p": p},
-            percentiles={
-                10: nbinom.ppf(0.10, r, p),
-                25: nbinom.ppf(0.25, r, p),
-                50: nbinom.ppf(0.50, r, p),
-                75: nbinom.ppf(0.75, r, p),
-                90: nbinom.ppf(0.90, r, p),
-            }
+            params={"r": r, "p": p}
         )
     
     def create_joint_projection(
@@ -306,17 +363,24 @@ class DistributionModeler:
         
         Returns DataFrame with simulated stat lines
         """
+        return pd.DataFrame(self._simulate_joint_arrays(projection, n_sims))
+
+    def _simulate_joint_arrays(
+        self,
+        projection: JointProjection,
+        n_sims: Optional[int] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Monte Carlo simulation of joint outcomes as raw arrays
+
+        Returns dict of stat name -> simulated float32 values (one entry per
+        sim). Single precision is ample next to the ~1/sqrt(n) Monte Carlo
+        error and halves memory traffic in the combo sweeps.
+        """
         n = n_sims or self.n_simulations
         
-        # Generate correlated uniform random variables via Gaussian copula
-        normal_samples = np.random.multivariate_normal(
-            mean=np.zeros(7),
-            cov=projection.correlation_matrix,
-            size=n
-        )
-        
-        # Transform to uniform via normal CDF
-        uniform_samples = norm.cdf(normal_samples)
+        # Generate correlated standard normals via Gaussian copula: Z @ L.T
+        normal_samples = self._rng.standard_normal((n, 7), dtype=np.float32) @ projection._chol.T
         
         # Transform to each marginal distribution
         results = {}
@@ -333,16 +397,19 @@ class DistributionModeler:
         
         for i, (stat_name, proj) in enumerate(zip(self.STAT_NAMES, stat_projections)):
             if proj is None:
-                results[stat_name] = np.zeros(n)
+                results[stat_name] = np.zeros(n, dtype=np.float32)
                 continue
                 
-            if proj.distribution == "normal":
-                results[stat_name] = norm.ppf(uniform_samples[:, i], proj.mean, proj.std)
-            elif proj.distribution == "poisson":
-                results[stat_name] = poisson.ppf(uniform_samples[:, i], proj.mean)
-            elif proj.distribution == "negbinom":
-                r, p = proj.params.get('r', 5), proj.params.get('p', 0.5)
-                results[stat_name] = nbinom.ppf(uniform_samples[:, i], r, p)
+            if proj.distribution in ("poisson", "negbinom"):
+                # Normal -> uniform via ndtr ufunc, then the frozen marginal's PPF.
+                # ndtr runs in float64 (float32 rounds to exactly 1.0 past z ~ 5.4)
+                # and u stays below 1, where a discrete PPF would return inf
+                u = ndtr(normal_samples[:, i].astype(np.float64))
+                np.minimum(u, _MAX_UNIFORM, out=u)
+                results[stat_name] = proj._rv.ppf(u).astype(np.float32)
+            else:
+                # norm.ppf(norm.cdf(z), mean, std) == mean + std * z
+                results[stat_name] = np.float32(proj.mean) + np.float32(proj.std) * normal_samples[:, i]
         
         # Calculate combo stats
         results['pts_reb_ast'] = results['points'] + results['rebounds'] + results['assists']
@@ -350,7 +417,7 @@ class DistributionModeler:
         results['pts_ast'] = results['points'] + results['assists']
         results['reb_ast'] = results['rebounds'] + results['assists']
         
-        return pd.DataFrame(results)
+        return results
     
     def calculate_combo_probability(
         self,
@@ -366,18 +433,19 @@ class DistributionModeler:
             lines: Dict of stat_name -> line
             all_overs: True for all overs, False for all unders
         """
-        sims = self.simulate_joint_outcomes(projection)
+        sims = self._simulate_joint_arrays(projection)
         
-        hits = np.ones(len(sims), dtype=bool)
+        hits = np.ones(len(sims['points']), dtype=bool)
         
         for stat, line in lines.items():
-            if stat in sims.columns:
+            arr = sims.get(stat)
+            if arr is not None:
                 if all_overs:
-                    hits &= (sims[stat] > line)
+                    hits &= (arr > line)
                 else:
-                    hits &= (sims[stat] < line)
+                    hits &= (arr < line)
         
-        return hits.mean()
+        return float(hits.mean())
     
     def estimate_correlation_from_data(
         self,
@@ -394,13 +462,34 @@ class DistributionModeler:
             return self.DEFAULT_CORRELATIONS
         
         # Calculate correlation matrix
-        corr_matrix = game_logs[available_cols].corr().values
-        
-        # Ensure positive semi-definite
-        eigvals = np.linalg.eigvalsh(corr_matrix)
+        values = game_logs[available_cols].to_numpy(dtype=np.float64, copy=True)
+        if len(values) == 0 or np.isnan(values).any():
+            # Missing entries: keep pandas' pairwise-complete correlation
+            corr_matrix = game_logs[available_cols].corr().to_numpy()
+        elif HAS_NUMBA:
+            corr_matrix = _standardized_corr_kernel(values)
+        else:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                corr_matrix = np.corrcoef(values, rowvar=False)
+        
+        # Constant columns (e.g. FG3M all 0 for a non-shooter) and short logs
+        # have no defined correlation; use the default structure for them
+        finite = np.isfinite(corr_matrix)
+        if not finite.all():
+            idx = [stat_cols.index(c) for c in available_cols]
+            defaults = self.DEFAULT_CORRELATIONS[np.ix_(idx, idx)]
+            corr_matrix = np.where(finite, corr_matrix, defaults)
+        
+        # Ensure positive semi-definite; a successful Cholesky proves it, so
+        # the eigendecomposition only runs for borderline matrices
+        try:
+            np.linalg.cholesky(corr_matrix)
+            return corr_matrix
+        except np.linalg.LinAlgError:
+            eigvals = np.linalg.eigvalsh(corr_matrix)
         if np.min(eigvals) < 0:
             # Fix by adding small value to diagonal
-            corr_matrix += np.eye(len(corr_matrix)) * (abs(np.min(eigvals)) + 0.01)
+            corr_matrix = corr_matrix + np.eye(len(corr_matrix)) * (abs(np.min(eigvals)) + 0.01)
             # Re-normalize to correlations
             d = np.sqrt(np.diag(corr_matrix))
             corr_matrix = corr_matrix / np.outer(d, d)
@@ -408,6 +497,42 @@ class DistributionModeler:
         return corr_matrix
 
 
+def correlation_factor(corr: np.ndarray) -> np.ndarray:
+    """
+    Factor L with L @ L.T == corr
+
+    Uses Cholesky (L lower-triangular); matrices that are only positive
+    semi-definite fall back to an eigendecomposition, whose factor is
+    square but not triangular.
+
+    Raises:
+        ValueError: if corr has NaN or infinite entries
+    """
+    if not np.isfinite(corr).all():
+        raise ValueError("correlation matrix has non-finite entries")
+    try:
+        return np.linalg.cholesky(corr)
+    except np.linalg.LinAlgError:
+        eigvals, eigvecs = np.linalg.eigh(corr)
+        return eigvecs * np.sqrt(np.clip(eigvals, 0, None))
+
+
+@lru_cache(maxsize=256)
+def american_to_implied(odds: int) -> float:
+    """Convert American odds to implied probability (cached; slates reuse a few prices)"""
+    if odds < 0:
+        return abs(odds) / (abs(odds) + 100)
+    return 100 / (odds + 100)
+
+
+@lru_cache(maxsize=256)
+def american_to_decimal(odds: int) -> float:
+    """Convert American odds to decimal odds (cached; slates reuse a few prices)"""
+    if odds < 0:
+        return 1 + 100 / abs(odds)
+    return 1 + odds / 100
+
+
 def calculate_edge(
     model_prob: float,
     line_odds: int
@@ -423,19 +548,13 @@ def calculate_edge(
         Tuple of (edge, expected_value)
     """
     # Convert American odds to implied probability
-    if line_odds < 0:
-        implied_prob = abs(line_odds) / (abs(line_odds) + 100)
-    else:
-        implied_prob = 100 / (line_odds + 100)
+    implied_prob = american_to_implied(line_odds)
     
     # Edge is the difference between model prob and implied prob
     edge = model_prob - implied_prob
     
     # Calculate EV per dollar bet
-    if line_odds < 0:
-        profit_if_win = 100 / abs(line_odds)
-    else:
-        profit_if_win = line_odds / 100
+    profit_if_win = american_to_decimal(line_odds) - 1
     
     ev = model_prob * profit_if_win - (1 - model_prob) * 1
     
@@ -462,19 +581,13 @@ def kelly_criterion(
         return 0.0
     
     # Convert odds to decimal
-    if odds < 0:
-        decimal_odds = 1 + 100 / abs(odds)
-    else:
-        decimal_odds = 1 + odds / 100
+    decimal_odds = american_to_decimal(odds)
     
     # Kelly formula: f = (bp - q) / b where b = odds-1, p = prob, q = 1-p
     b = decimal_odds - 1
     
     # Back-calculate probability from edge + implied
-    if odds < 0:
-        implied = abs(odds) / (abs(odds) + 100)
-    else:
-        implied = 100 / (odds + 100)
+    implied = american_to_implied(odds)
     
     p = implied + edge
     q = 1 - p
@@ -13,12 +13,133 @@ Components:
 3. Blending: Weighted average of both model outputs
 """
 
-from typing import Dict, List, Optional, Tuple, Any
+from math import erfc, sqrt
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Tuple, Any
 import numpy as np
 from dataclasses import dataclass, field
 
+from ..jit import njit, prange, HAS_NUMBA
 
-@dataclass
+_SQRT2 = sqrt(2.0)
+
+# Shared read-only importances for predictions without any ML model
+_EMPTY_IMPORTANCES: Mapping[str, float] = MappingProxyType({})
+
+# Stats and signals feeding the simple ML model's feature vector
+_AVERAGE_STATS = ('pts', 'reb', 'ast', 'fg3m')
+_SIGNAL_NAMES = ('injury_alpha', 'b2b', 'pace', 'defense',
+                 'blowout', 'home_away', 'recent_form',
+                 'fatigue', 'referee', 'line_movement')
+
+
+def _flag(value: Any) -> float:
+    return 1.0 if value else 0.0
+
+
+@njit(
+    'Tuple((int64, float64, float64, float64, float64))(float32[:], int64[:, :], float32[:, :])',
+    cache=True, parallel=True,
+)
+def _fit_stump_kernel(residuals, sorted_idx, sorted_X):
+    """
+    Find the best single split over every feature and split point.
+
+    Each feature's residuals are swept once in presorted order, keeping a
+    running left sum; a split is only allowed between distinct values and
+    with at least two samples on each side.
+
+    Returns (feature_idx, threshold, left_value, right_value, improvement);
+    feature_idx is -1 when no split improves the MSE.
+    """
+    n_samples = residuals.shape[0]
+    n_features = sorted_idx.shape[1]
+    improvements = np.zeros(n_features)
+    split_at = np.zeros(n_features, dtype=np.int64)
+    left_sums = np.zeros(n_features)
+
+    total_sum = 0.0
+    for i in range(n_samples):
+        total_sum += residuals[i]
+
+    # Against the uncentered base MSE, a split's improvement reduces to
+    # (S_L^2 / n_L + S_R^2 / n_R) / N, so only the left sum is needed.
+    for f in prange(n_features):
+        sum_left = 0.0
+        for k in range(n_samples - 2):
+            sum_left += residuals[sorted_idx[k, f]]
+            nl = k + 1
+            if nl < 2 or sorted_X[k, f] == sorted_X[k + 1, f]:
+                continue
+            nr = n_samples - nl
+            sum_right = total_sum - sum_left
+            gain = (sum_left * sum_left / nl + sum_right * sum_right / nr) / n_samples
+            if gain > improvements[f]:
+                improvements[f] = gain
+                split_at[f] = nl
+                left_sums[f] = sum_left
+
+    best_idx = -1
+    best_improvement = 0.0
+    for f in range(n_features):
+        if improvements[f] > best_improvement:
+            best_improvement = improvements[f]
+            best_idx = f
+
+    if best_idx < 0:
+        return -1, 0.0, 0.0, 0.0, 0.0
+    nl = split_at[best_idx]
+    nr = n_samples - nl
+    sum_left = left_sums[best_idx]
+    return (best_idx, float(sorted_X[nl - 1, best_idx]), sum_left / nl,
+            (total_sum - sum_left) / nr, best_improvement)
+
+
+@njit(
+    'float32[:](float32[:, :], int32[:], float32[:], float32[:], float32[:], float32, float32)',
+    cache=True, parallel=True,
+)
+def _predict_compact_kernel(X, feat_idx, thresh, left, right, learning_rate, base):
+    """Sum every stump's contribution per sample in a single pass."""
+    n_samples = X.shape[0]
+    n_stumps = feat_idx.shape[0]
+    out = np.empty(n_samples, dtype=np.float32)
+    for i in prange(n_samples):
+        p = base
+        for k in range(n_stumps):
+            if X[i, feat_idx[k]] <= thresh[k]:
+                p += learning_rate * left[k]
+            else:
+                p += learning_rate * right[k]
+        out[i] = p
+    return out
+
+
+@njit(
+    'void(float32[:, :], float32[:], float32[:], float32[:], int64, float32, float32, float32, float32)',
+    cache=True, parallel=True,
+)
+def _apply_stump_kernel(X, y, predictions, residuals, feature_idx, threshold,
+                        left_value, right_value, learning_rate):
+    """Add one stump's shrunken output to predictions and refresh residuals in place."""
+    for i in prange(X.shape[0]):
+        if X[i, feature_idx] <= threshold:
+            predictions[i] += learning_rate * left_value
+        else:
+            predictions[i] += learning_rate * right_value
+        residuals[i] = y[i] - predictions[i]
+
+
+@njit('float64[:](float64[:])', cache=True)
+def _normal_sf_kernel(z):
+    """Standard normal survival function P(Z > z), elementwise via erfc."""
+    out = np.empty(z.shape[0])
+    for i in range(z.shape[0]):
+        out[i] = 0.5 * erfc(z[i] / _SQRT2)
+    return out
+
+
+@dataclass(slots=True, frozen=True)
 class EnsemblePrediction:
     """Output from ensemble model."""
     stat_type: str
@@ -30,7 +151,8 @@ class EnsemblePrediction:
     analytical_weight: float
     ml_weight: float
     confidence: float
-    feature_importances: Dict[str, float] = field(default_factory=dict)
+    # The factory hands out the shared empty proxy rather than a new dict
+    feature_importances: Mapping[str, float] = field(default_factory=lambda: _EMPTY_IMPORTANCES)
 
 
 class SimpleGradientBoostedModel:
@@ -49,6 +171,14 @@ class SimpleGradientBoostedModel:
     - Signal outputs
     """
 
+    __slots__ = (
+        'n_estimators', 'learning_rate', 'max_depth', '_stumps',
+        'base_prediction', 'is_fitted', 'feature_names',
+        '_sorted_X', '_sorted_idx',
+        '_feat_idx', '_thresh', '_left', '_right', '_improvements',
+        '_feature_importance_cache',
+    )
+
     def __init__(
         self,
         n_estimators: int = 50,
@@ -63,6 +193,31 @@ class SimpleGradientBoostedModel:
         self.is_fitted: bool = False
         self.feature_names: List[str] = []
 
+        # Per-fit presort of the training columns, reused by every boosting round
+        self._sorted_X: Optional[np.ndarray] = None
+        self._sorted_idx: Optional[np.ndarray] = None
+
+        # Stumps frozen into parallel arrays for prediction (see _compact)
+        self._feat_idx: Optional[np.ndarray] = None
+        self._thresh: Optional[np.ndarray] = None
+        self._left: Optional[np.ndarray] = None
+        self._right: Optional[np.ndarray] = None
+        self._improvements: Optional[np.ndarray] = None
+        self._feature_importance_cache: Optional[Dict[str, float]] = None
+
+    @property
+    def stumps(self) -> List[Dict]:
+        """Fitted stumps as JSON-serializable dicts (the persisted form)."""
+        return self._stumps
+
+    @stumps.setter
+    def stumps(self, stumps: List[Dict]):
+        # Assigning stumps directly (e.g. when loading a saved model)
+        # invalidates the compacted arrays; they are rebuilt on next use.
+        self._stumps = stumps
+        self._feat_idx = None
+        self._feature_importance_cache = None
+
     def fit(self, X: np.ndarray, y: np.ndarray, feature_names: List[str] = None):
         """
         Fit the model using gradient boosting with decision stumps.
@@ -73,16 +228,21 @@ class SimpleGradientBoostedModel:
             feature_names: Optional names for features
         """
         self.feature_names = feature_names or [f'f{i}' for i in range(X.shape[1])]
-        self.base_prediction = np.mean(y)
+        # Column-major float32 copy so the stump search scans each feature
+        # contiguously; stat projections need nowhere near float64 precision
+        X = np.asfortranarray(X, dtype=np.float32)
+        y = np.asarray(y, dtype=np.float32)
+        # Kept as a Python float so the model stays JSON-serializable
+        self.base_prediction = float(np.mean(y, dtype=np.float64))
         self.stumps = []
+        self._presort(X)
 
-        # Initialize predictions
-        predictions = np.full(len(y), self.base_prediction)
+        # Initialize predictions; all per-round buffers are updated in place
+        predictions = np.full(len(y), self.base_prediction, dtype=np.float32)
+        residuals = np.subtract(y, predictions)
+        stump_preds = np.empty_like(predictions)
 
         for _ in range(self.n_estimators):
-            # Calculate residuals
-            residuals = y - predictions
-
             # Fit a decision stump to the residuals
             best_stump = self._fit_stump(X, residuals)
             if best_stump is None:
@@ -90,89 +250,166 @@ class SimpleGradientBoostedModel:
 
             self.stumps.append(best_stump)
 
-            # Update predictions
-            stump_preds = self._predict_stump(X, best_stump)
-            predictions += self.learning_rate * stump_preds
+            # Update predictions and residuals
+            self._apply_stump(X, y, best_stump, predictions, residuals, stump_preds)
 
+        # Presorted copies are only needed while fitting
+        self._sorted_X = self._sorted_idx = None
+        self._compact()
+        self._feature_importance_cache = None
         self.is_fitted = True
 
+    def _compact(self):
+        """Freeze the stump dicts into parallel arrays for prediction."""
+        stumps = self._stumps
+        self._thresh = np.array([s['threshold'] for s in stumps], dtype=np.float32)
+        self._left = np.array([s['left_value'] for s in stumps], dtype=np.float32)
+        self._right = np.array([s['right_value'] for s in stumps], dtype=np.float32)
+        self._improvements = np.array([s['improvement'] for s in stumps], dtype=np.float64)
+        self._feat_idx = np.array([s['feature_idx'] for s in stumps], dtype=np.int32)
+
+    def _presort(self, X: np.ndarray):
+        """Sort every feature column once per fit."""
+        self._sorted_idx = np.asfortranarray(np.argsort(X, axis=0, kind='stable'))
+        self._sorted_X = np.asfortranarray(np.take_along_axis(X, self._sorted_idx, axis=0))
+
     def predict(self, X: np.ndarray) -> np.ndarray:
         """Predict using the fitted ensemble."""
         if not self.is_fitted:
-            return np.full(X.shape[0], self.base_prediction)
+            return np.full(X.shape[0], self.base_prediction, dtype=np.float32)
 
-        predictions = np.full(X.shape[0], self.base_prediction)
-        for stump in self.stumps:
-            predictions += self.learning_rate * self._predict_stump(X, stump)
+        if self._feat_idx is None:
+            self._compact()
+
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        if HAS_NUMBA:
+            return _predict_compact_kernel(
+                X, self._feat_idx, self._thresh, self._left, self._right,
+                np.float32(self.learning_rate), np.float32(self.base_prediction),
+            )
+
+        predictions = np.full(X.shape[0], self.base_prediction, dtype=np.float32)
+        for k in range(len(self._feat_idx)):
+            predictions += self.learning_rate * np.where(
+                X[:, self._feat_idx[k]] <= self._thresh[k], self._left[k], self._right[k]
+            )
 
         return predictions
 
     def get_feature_importance(self) -> Dict[str, float]:
-        """Get feature importance scores."""
-        importances = np.zeros(len(self.feature_names))
+        """
+        Get feature importance scores.
+
+        The dict is computed once per set of stumps and shared between
+        calls; callers must copy it before mutating.
+        """
+        if self._feature_importance_cache is not None:
+            return self._feature_importance_cache
+
+        if self._feat_idx is None:
+            self._compact()
 
-        for stump in self.stumps:
-            idx = stump['feature_idx']
-            importances[idx] += abs(stump['improvement'])
+        importances = np.bincount(
+            self._feat_idx, weights=np.abs(self._improvements),
+            minlength=len(self.feature_names),
+        )
 
         # Normalize
         total = importances.sum()
         if total > 0:
             importances /= total
 
-        return dict(zip(self.feature_names, importances))
+        self._feature_importance_cache = dict(zip(self.feature_names, importances.tolist()))
+        return self._feature_importance_cache
 
     def _fit_stump(
         self,
         X: np.ndarray,
         residuals: np.ndarray,
     ) -> Optional[Dict]:
-        """Fit a single decision stump (1-level tree)."""
+        """
+        Fit a single decision stump (1-level tree).
+
+        Every split point of every presorted column is scored in one
+        prefix-sum sweep per feature.
+        """
+        if HAS_NUMBA:
+            feat_idx, threshold, left_pred, right_pred, improvement = _fit_stump_kernel(
+                residuals, self._sorted_idx, self._sorted_X
+            )
+            if feat_idx < 0:
+                return None
+            return {
+                'feature_idx': int(feat_idx),
+                'threshold': threshold,
+                'left_value': left_pred,
+                'right_value': right_pred,
+                'improvement': improvement,
+            }
+
         n_samples, n_features = X.shape
+        if n_samples < 4:
+            return None
+
         best_improvement = 0.0
         best_stump = None
 
-        base_mse = np.mean(residuals ** 2)
+        total_sum = float(residuals.sum(dtype=np.float64))
+        # Candidate left sizes: at least two samples on either side
+        n_left = np.arange(2, n_samples - 1)
+        n_right = n_samples - n_left
 
         for feat_idx in range(n_features):
-            feature_values = X[:, feat_idx]
-            # Try median as split point (fast approximation)
-            threshold = np.median(feature_values)
-
-            left_mask = feature_values <= threshold
-            right_mask = ~left_mask
-
-            if left_mask.sum() < 2 or right_mask.sum() < 2:
-                continue
-
-            left_pred = np.mean(residuals[left_mask])
-            right_pred = np.mean(residuals[right_mask])
-
-            # Calculate improvement
-            preds = np.where(left_mask, left_pred, right_pred)
-            new_mse = np.mean((residuals - preds) ** 2)
-            improvement = base_mse - new_mse
-
+            col = self._sorted_X[:, feat_idx]
+            cum = np.cumsum(residuals[self._sorted_idx[:, feat_idx]], dtype=np.float64)
+            sum_left = cum[n_left - 1]
+            sum_right = total_sum - sum_left
+
+            # Closed-form MSE reduction: (S_L^2 / n_L + S_R^2 / n_R) / N
+            gains = (sum_left * sum_left / n_left + sum_right * sum_right / n_right) / n_samples
+            # Only split between distinct values
+            gains[col[n_left - 1] == col[n_left]] = 0.0
+
+            k = int(np.argmax(gains))
+            improvement = float(gains[k])
             if improvement > best_improvement:
                 best_improvement = improvement
+                nl = int(n_left[k])
                 best_stump = {
                     'feature_idx': feat_idx,
-                    'threshold': threshold,
-                    'left_value': left_pred,
-                    'right_value': right_pred,
+                    'threshold': float(col[nl - 1]),
+                    'left_value': float(sum_left[k]) / nl,
+                    'right_value': float(sum_right[k]) / (n_samples - nl),
                     'improvement': improvement,
                 }
 
         return best_stump
 
-    def _predict_stump(self, X: np.ndarray, stump: Dict) -> np.ndarray:
-        """Predict using a single stump."""
-        feature_values = X[:, stump['feature_idx']]
-        return np.where(
-            feature_values <= stump['threshold'],
-            stump['left_value'],
-            stump['right_value'],
-        )
+    def _apply_stump(
+        self,
+        X: np.ndarray,
+        y: np.ndarray,
+        stump: Dict,
+        predictions: np.ndarray,
+        residuals: np.ndarray,
+        stump_preds: np.ndarray,
+    ):
+        """Add a stump's contribution to predictions and recompute residuals, in place."""
+        lr = np.float32(self.learning_rate)
+        left = np.float32(stump['left_value'])
+        right = np.float32(stump['right_value'])
+        if HAS_NUMBA:
+            _apply_stump_kernel(
+                X, y, predictions, residuals, stump['feature_idx'],
+                np.float32(stump['threshold']), left, right, lr,
+            )
+            return
+
+        stump_preds.fill(right)
+        np.copyto(stump_preds, left, where=X[:, stump['feature_idx']] <= stump['threshold'])
+        stump_preds *= lr
+        predictions += stump_preds
+        np.subtract(y, predictions, out=residuals)
 
 
 class EnsembleProjector:
@@ -187,6 +424,11 @@ class EnsembleProjector:
     to maximize ensemble accuracy.
     """
 
+    __slots__ = (
+        'analytical_weight', 'ml_weight', 'per_stat_xgb_weights', 'ml_models',
+        '_xgb_model', '_xgb_feature_builder',
+    )
+
     # Per-stat XGBoost weight overrides.
     # Higher for stable, high-data stats; lower for volatile, sparse stats.
     DEFAULT_PER_STAT_XGB_WEIGHTS: Dict[str, float] = {
@@ -204,6 +446,33 @@ class EnsembleProjector:
     HIGH_CONFIDENCE_THRESHOLD = 0.70
     LOW_CONFIDENCE_THRESHOLD = 0.30
 
+    # ML feature layout: (name, context section or None for top level, key,
+    # default, converter). Column order of every feature vector/matrix.
+    _FEATURE_LAYOUT: Tuple[Tuple[str, Optional[str], str, Any, Callable[[Any], float]], ...] = (
+        *((f'season_{stat}', 'season_averages', stat, 0.0, float) for stat in _AVERAGE_STATS),
+        *((f'l5_{stat}', 'last_5_averages', stat, 0.0, float) for stat in _AVERAGE_STATS),
+        *((f'l10_{stat}', 'last_10_averages', stat, 0.0, float) for stat in _AVERAGE_STATS),
+        ('is_b2b', None, 'is_b2b', False, _flag),
+        ('is_home', None, 'is_home', True, _flag),
+        ('opp_pace', None, 'opponent_pace', 100.0, float),
+        ('opp_def_rating', None, 'opponent_def_rating', 110.0, float),
+        ('abs_spread', None, 'vegas_spread', 0.0, abs),
+        ('vegas_total', None, 'vegas_total', 225.0, float),
+        ('proj_minutes', None, 'projected_minutes', 30.0, float),
+        *((f'signal_{name}', 'signal_adjustments', name, 0.0, float) for name in _SIGNAL_NAMES),
+    )
+    _FEATURE_NAMES: Tuple[str, ...] = tuple(entry[0] for entry in _FEATURE_LAYOUT)
+
+    # Per-stat (coefficient of variation, season-average key) for _estimate_std
+    _STAT_CONFIG: Dict[str, Tuple[float, str]] = {
+        'Points': (0.30, 'pts'),
+        'Rebounds': (0.35, 'reb'),
+        'Assists': (0.40, 'ast'),
+        '3-Pointers Made': (0.60, 'fg3m'),
+        'Pts+Rebs+Asts': (0.25, 'pra'),
+    }
+    _DEFAULT_STAT_CONFIG: Tuple[float, str] = (0.35, 'pts')
+
     def __init__(
         self,
         analytical_weight: float = 0.65,
@@ -285,60 +554,28 @@ class EnsembleProjector:
 
         Returns (feature_array, feature_names)
         """
-        features = []
-        names = []
-
-        # Season averages
-        season = context.get('season_averages', {})
-        for stat in ['pts', 'reb', 'ast', 'fg3m']:
-            features.append(season.get(stat, 0.0))
-            names.append(f'season_{stat}')
-
-        # L5 averages
-        l5 = context.get('last_5_averages', {})
-        for stat in ['pts', 'reb', 'ast', 'fg3m']:
-            features.append(l5.get(stat, 0.0))
-            names.append(f'l5_{stat}')
-
-        # L10 averages
-        l10 = context.get('last_10_averages', {})
-        for stat in ['pts', 'reb', 'ast', 'fg3m']:
-            features.append(l10.get(stat, 0.0))
-            names.append(f'l10_{stat}')
-
-        # Situational
-        features.append(1.0 if context.get('is_b2b', False) else 0.0)
-        names.append('is_b2b')
-
-        features.append(1.0 if context.get('is_home', True) else 0.0)
-        names.append('is_home')
-
-        # Opponent
-        features.append(context.get('opponent_pace', 100.0))
-        names.append('opp_pace')
-
-        features.append(context.get('opponent_def_rating', 110.0))
-        names.append('opp_def_rating')
-
-        features.append(abs(context.get('vegas_spread', 0.0)))
-        names.append('abs_spread')
-
-        features.append(context.get('vegas_total', 225.0))
-        names.append('vegas_total')
-
-        # Minutes projection
-        features.append(context.get('projected_minutes', 30.0))
-        names.append('proj_minutes')
-
-        # Signal outputs (if available)
-        signals = context.get('signal_adjustments', {})
-        for signal_name in ['injury_alpha', 'b2b', 'pace', 'defense',
-                            'blowout', 'home_away', 'recent_form',
-                            'fatigue', 'referee', 'line_movement']:
-            features.append(signals.get(signal_name, 0.0))
-            names.append(f'signal_{signal_name}')
-
-        return np.array(features).reshape(1, -1), names
+        out = np.empty((1, len(self._FEATURE_LAYOUT)), dtype=np.float32)
+        self._fill_feature_row(context, out[0])
+        return out, list(self._FEATURE_NAMES)
+
+    def build_feature_matrix(self, training_data: List[Dict[str, Any]]) -> np.ndarray:
+        """Build the (n_contexts, n_features) ML feature matrix in one allocation."""
+        X = np.empty((len(training_data), len(self._FEATURE_LAYOUT)), dtype=np.float32)
+        for row, ctx in zip(X, training_data):
+            self._fill_feature_row(ctx, row)
+        return X
+
+    def _fill_feature_row(self, context: Dict[str, Any], row: np.ndarray) -> None:
+        """Write one context's features into a preallocated row."""
+        sections = {}
+        for j, (_, section, key, default, convert) in enumerate(self._FEATURE_LAYOUT):
+            if section is None:
+                source = context
+            else:
+                source = sections.get(section)
+                if source is None:
+                    source = sections[section] = context.get(section, {})
+            row[j] = convert(source.get(key, default))
 
     def train_ml_model(
         self,
@@ -357,19 +594,11 @@ class EnsembleProjector:
         if len(training_data) < 30:
             return  # Not enough data
 
-        X_list = []
-        feature_names = None
-        for ctx in training_data:
-            feat_vec, names = self.build_feature_vector(ctx)
-            X_list.append(feat_vec.flatten())
-            if feature_names is None:
-                feature_names = names
-
-        X = np.array(X_list)
+        X = self.build_feature_matrix(training_data)
         y = np.array(actuals)
 
         model = SimpleGradientBoostedModel(n_estimators=50, learning_rate=0.1)
-        model.fit(X, y, feature_names)
+        model.fit(X, y, list(self._FEATURE_NAMES))
         self.ml_models[stat_type] = model
 
     def predict(
@@ -378,6 +607,7 @@ class EnsembleProjector:
         analytical_projection: float,
         context: Dict[str, Any],
         line: Optional[float] = None,
+        features: Optional[np.ndarray] = None,
     ) -> EnsemblePrediction:
         """
         Generate ensemble prediction.
@@ -387,19 +617,19 @@ class EnsembleProjector:
             analytical_projection: Output from analytical model
             context: Full context dict
             line: Optional betting line
+            features: Optional ML feature vector already built from context
+                      by build_feature_vector (reused across stat types)
 
         Returns:
             EnsemblePrediction with blended output
         """
-        # Get ML prediction
-        ml_projection = analytical_projection  # Default to analytical if no ML model
-        feature_importances = {}
+        if stat_type not in self.ml_models:
+            return self._predict_without_ml(stat_type, analytical_projection, context, line)
 
-        if stat_type in self.ml_models:
-            model = self.ml_models[stat_type]
-            X, _ = self.build_feature_vector(context)
-            ml_projection = float(model.predict(X)[0])
-            feature_importances = model.get_feature_importance()
+        # Get ML prediction
+        model = self.ml_models[stat_type]
+        X = features if features is not None else self.build_feature_vector(context)[0]
+        ml_projection = float(model.predict(X)[0])
 
         # Blend
         ensemble_projection = (
@@ -407,26 +637,10 @@ class EnsembleProjector:
             self.ml_weight * ml_projection
         )
 
-        # Calculate probabilities if line provided
-        prob_over = 0.5
-        prob_under = 0.5
-        if line is not None:
-            # Use ensemble projection and estimated std
-            std = self._estimate_std(stat_type, context)
-            if std > 0:
-                from scipy.stats import norm
-                prob_over = 1 - norm.cdf(line, ensemble_projection, std)
-                prob_under = 1 - prob_over
-
-            # Blend with XGBoost probability using confidence-adaptive weighting
-            xgb_pred = self.get_xgboost_prediction(stat_type, context)
-            if xgb_pred is not None:
-                xgb_weight = self._get_adaptive_xgb_weight(
-                    stat_type, xgb_pred["confidence"]
-                )
-                prob_over = (1 - xgb_weight) * prob_over + xgb_weight * xgb_pred["prob_over"]
-                prob_under = 1 - prob_over
-                feature_importances.update(xgb_pred.get("feature_importances", {}))
+        prob_over, prob_under, feature_importances = self._line_probabilities(
+            stat_type, ensemble_projection, context, line,
+            model.get_feature_importance(),
+        )
 
         # Confidence based on model agreement
         if analytical_projection > 0:
@@ -448,6 +662,204 @@ class EnsembleProjector:
             feature_importances=feature_importances,
         )
 
+    def _predict_without_ml(
+        self,
+        stat_type: str,
+        analytical_projection: float,
+        context: Dict[str, Any],
+        line: Optional[float],
+    ) -> EnsemblePrediction:
+        """
+        Prediction for a stat with no trained ML model.
+
+        The analytical projection is used as-is: no blend, and a neutral
+        confidence since there is no second model to agree with.
+        """
+        prob_over, prob_under, feature_importances = self._line_probabilities(
+            stat_type, analytical_projection, context, line, _EMPTY_IMPORTANCES,
+        )
+        return EnsemblePrediction(
+            stat_type=stat_type,
+            analytical_projection=analytical_projection,
+            ml_projection=analytical_projection,
+            ensemble_projection=analytical_projection,
+            prob_over=prob_over,
+            prob_under=prob_under,
+            analytical_weight=1.0,
+            ml_weight=0.0,
+            confidence=0.5,
+            feature_importances=feature_importances,
+        )
+
+    def _line_probabilities(
+        self,
+        stat_type: str,
+        projection: float,
+        context: Dict[str, Any],
+        line: Optional[float],
+        feature_importances: Mapping[str, float],
+    ) -> Tuple[float, float, Mapping[str, float]]:
+        """
+        Over/under probabilities for a line around a projection.
+
+        Returns (prob_over, prob_under, feature_importances), the latter
+        extended with XGBoost importances when its probability is blended in.
+        """
+        prob_over = 0.5
+        prob_under = 0.5
+        if line is None:
+            return prob_over, prob_under, feature_importances
+
+        # Use projection and estimated std
+        std = self._estimate_std(stat_type, context)
+        if std > 0:
+            # Normal survival function: P(X > line) = erfc(z / sqrt(2)) / 2
+            prob_over = 0.5 * erfc((line - projection) / (std * _SQRT2))
+            prob_under = 1.0 - prob_over
+
+        # Blend with XGBoost probability using confidence-adaptive weighting
+        xgb_pred = self.get_xgboost_prediction(stat_type, context)
+        if xgb_pred is not None:
+            xgb_weight = self._get_adaptive_xgb_weight(
+                stat_type, xgb_pred["confidence"]
+            )
+            prob_over = (1 - xgb_weight) * prob_over + xgb_weight * xgb_pred["prob_over"]
+            prob_under = 1 - prob_over
+            # The model's importance dict is shared; merge into a new one
+            feature_importances = {
+                **feature_importances, **xgb_pred.get("feature_importances", {})
+            }
+
+        return prob_over, prob_under, feature_importances
+
+    def predict_many(
+        self,
+        stat_type: str,
+        analytical_projections: np.ndarray,
+        contexts: List[Dict[str, Any]],
+        lines: Optional[np.ndarray] = None,
+    ) -> List[EnsemblePrediction]:
+        """
+        Generate ensemble predictions for many contexts of one stat type.
+
+        Equivalent to calling predict() per context, but the ML features are
+        built as one matrix and the model, blend, probabilities and
+        confidence are evaluated over all samples at once.
+
+        Args:
+            stat_type: Stat type being predicted
+            analytical_projections: Analytical model output per context
+            contexts: Full context dict per sample
+            lines: Optional betting line per context (NaN/None for no line)
+
+        Returns:
+            One EnsemblePrediction per context, in input order
+        """
+        if stat_type not in self.ml_models:
+            if lines is None:
+                lines = [None] * len(contexts)
+            return [
+                self._predict_without_ml(
+                    stat_type, float(a), ctx,
+                    None if line is None or np.isnan(line) else float(line),
+                )
+                for a, ctx, line in zip(analytical_projections, contexts, lines)
+            ]
+
+        analytical = np.asarray(analytical_projections, dtype=np.float64)
+        n = len(contexts)
+
+        model = self.ml_models[stat_type]
+        ml = model.predict(self.build_feature_matrix(contexts))
+        feature_importances = model.get_feature_importance()
+
+        ensemble = self.analytical_weight * analytical + self.ml_weight * ml
+
+        prob_over = np.full(n, 0.5)
+        has_line = np.zeros(n, dtype=bool)
+        if lines is not None:
+            line_arr = np.array(
+                [np.nan if line is None else line for line in lines], dtype=np.float64
+            )
+            has_line = ~np.isnan(line_arr)
+            std = np.array([self._estimate_std(stat_type, ctx) for ctx in contexts])
+            use_cdf = has_line & (std > 0)
+            # P(X > line) = P(Z > (line - mu) / std)
+            prob_over[use_cdf] = _normal_sf_kernel(
+                (line_arr[use_cdf] - ensemble[use_cdf]) / std[use_cdf]
+            )
+
+        # Confidence based on model agreement
+        confidence = np.full(n, 0.5)
+        positive = analytical > 0
+        confidence[positive] = np.clip(
+            1.0 - np.abs(analytical[positive] - ml[positive]) / analytical[positive],
+            0.3, 0.9,
+        )
+
+        predictions = []
+        for i, ctx in enumerate(contexts):
+            p_over = float(prob_over[i])
+            importances = feature_importances
+            if has_line[i]:
+                # Blend with XGBoost probability using confidence-adaptive weighting
+                xgb_pred = self.get_xgboost_prediction(stat_type, ctx)
+                if xgb_pred is not None:
+                    xgb_weight = self._get_adaptive_xgb_weight(
+                        stat_type, xgb_pred["confidence"]
+                    )
+                    p_over = (1 - xgb_weight) * p_over + xgb_weight * xgb_pred["prob_over"]
+                    importances = {
+                        **feature_importances, **xgb_pred.get("feature_importances", {})
+                    }
+
+            predictions.append(EnsemblePrediction(
+                stat_type=stat_type,
+                analytical_projection=float(analytical[i]),
+                ml_projection=float(ml[i]),
+                ensemble_projection=float(ensemble[i]),
+                prob_over=p_over,
+                prob_under=1.0 - p_over if has_line[i] else 0.5,
+                analytical_weight=self.analytical_weight,
+                ml_weight=self.ml_weight,
+                confidence=float(confidence[i]),
+                feature_importances=importances,
+            ))
+
+        return predictions
+
+    def predict_all_stats(
+        self,
+        analytical_projections: Dict[str, float],
+        context: Dict[str, Any],
+        lines: Optional[Dict[str, float]] = None,
+    ) -> Dict[str, EnsemblePrediction]:
+        """
+        Generate ensemble predictions for several stat types of one context.
+
+        The ML feature vector depends only on the context, so it is built
+        once and shared by every stat type's model.
+
+        Args:
+            analytical_projections: Analytical model output per stat type
+            context: Full context dict
+            lines: Optional betting line per stat type
+
+        Returns:
+            Dict of stat type -> EnsemblePrediction
+        """
+        lines = lines or {}
+        X = None
+        if any(stat_type in self.ml_models for stat_type in analytical_projections):
+            X, _ = self.build_feature_vector(context)
+
+        return {
+            stat_type: self.predict(
+                stat_type, analytical, context, lines.get(stat_type), features=X
+            )
+            for stat_type, analytical in analytical_projections.items()
+        }
+
     def _get_adaptive_xgb_weight(self, stat_type: str, xgb_confidence: float) -> float:
         """
         Get XGBoost weight based on stat type and model confidence.
@@ -484,15 +896,6 @@ class EnsembleProjector:
 
     def _estimate_std(self, stat_type: str, context: Dict[str, Any]) -> float:
         """Estimate standard deviation for probability calculation."""
-        cv_estimates = {
-            'Points': 0.30, 'Rebounds': 0.35, 'Assists': 0.40,
-            '3-Pointers Made': 0.60, 'Pts+Rebs+Asts': 0.25,
-        }
-
-        cv = cv_estimates.get(stat_type, 0.35)
-        season = context.get('season_averages', {})
-        stat_key = {'Points': 'pts', 'Rebounds': 'reb', 'Assists': 'ast',
-                    '3-Pointers Made': 'fg3m', 'Pts+Rebs+Asts': 'pra'}.get(stat_type, 'pts')
-
-        mean = season.get(stat_key, 15.0)
+        cv, stat_key = self._STAT_CONFIG.get(stat_type, self._DEFAULT_STAT_CONFIG)
+        mean = context.get('season_averages', {}).get(stat_key, 15.0)
         return mean * cv
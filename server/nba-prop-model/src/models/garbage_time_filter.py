@@ -14,7 +14,7 @@ import pandas as pd
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FilteredStats:
     """Stats with garbage time filtered out."""
     pts_competitive: float  # Points scored in competitive minutes
@@ -82,6 +82,13 @@ class GarbageTimeFilter:
         35: 15.0,  # 35+ margin → ~15 min
     }
 
+    # STARTER_GARBAGE_MINUTES as a searchsorted lookup table; bucket 0 is
+    # below the lowest threshold (no garbage time)
+    _GARBAGE_THRESHOLDS = np.array(sorted(STARTER_GARBAGE_MINUTES), dtype=np.float64)
+    _GARBAGE_MINUTES = np.array(
+        [0.0] + [minutes for _, minutes in sorted(STARTER_GARBAGE_MINUTES.items())]
+    )
+
     # Per-minute production multiplier in garbage time
     # Starters produce less (often not playing), bench produces more
     GARBAGE_TIME_MULTIPLIER_STARTER = 0.6   # Starters less effective in garbage time
@@ -114,76 +121,41 @@ class GarbageTimeFilter:
                 garbage_minutes=0, games_with_garbage=0, total_games=0
             )
 
-        total_pts = 0.0
-        total_reb = 0.0
-        total_ast = 0.0
-        total_fg3m = 0.0
-        total_stl = 0.0
-        total_blk = 0.0
-        total_tov = 0.0
-        total_comp_min = 0.0
-        total_min = 0.0
-        total_garbage_min = 0.0
-        games_with_garbage = 0
-
-        for _, game in game_log.iterrows():
-            minutes = self._safe_float(game.get('MIN', 0))
-            if minutes <= 0:
-                continue
-
-            # Estimate garbage time minutes in this game
-            garbage_min = self._estimate_garbage_minutes(game, is_starter, minutes)
-            competitive_min = max(minutes - garbage_min, 0)
-
-            if garbage_min > 0:
-                games_with_garbage += 1
-
-            # Adjust stats to remove garbage time production
-            pts = self._safe_float(game.get('PTS', 0))
-            reb = self._safe_float(game.get('REB', 0))
-            ast = self._safe_float(game.get('AST', 0))
-            fg3m = self._safe_float(game.get('FG3M', 0))
-            stl = self._safe_float(game.get('STL', 0))
-            blk = self._safe_float(game.get('BLK', 0))
-            tov = self._safe_float(game.get('TOV', 0))
-
-            if garbage_min > 0 and minutes > 0:
-                # Estimate what portion of stats came in competitive time
-                comp_ratio = self._estimate_competitive_production_ratio(
-                    minutes, competitive_min, garbage_min, is_starter
-                )
-                total_pts += pts * comp_ratio
-                total_reb += reb * comp_ratio
-                total_ast += ast * comp_ratio
-                total_fg3m += fg3m * comp_ratio
-                total_stl += stl * comp_ratio
-                total_blk += blk * comp_ratio
-                total_tov += tov * comp_ratio
-            else:
-                total_pts += pts
-                total_reb += reb
-                total_ast += ast
-                total_fg3m += fg3m
-                total_stl += stl
-                total_blk += blk
-                total_tov += tov
-
-            total_comp_min += competitive_min
-            total_min += minutes
-            total_garbage_min += garbage_min
+        minutes = self._column(game_log, 'MIN')
+        played = minutes > 0
+        minutes = minutes[played]
+
+        # Estimate garbage time minutes in each game
+        if 'PLUS_MINUS' in game_log.columns:
+            margin = np.abs(self._column(game_log, 'PLUS_MINUS')[played])
+        elif 'final_margin' in game_log.columns:
+            margin = np.abs(self._column(game_log, 'final_margin')[played])
+        else:
+            margin = np.zeros_like(minutes)
+
+        garbage_min = self._estimate_garbage_minutes(margin, is_starter, minutes)
+        competitive_min = np.maximum(minutes - garbage_min, 0.0)
+
+        # Estimate what portion of stats came in competitive time
+        comp_ratio = self._estimate_competitive_production_ratio(
+            competitive_min, garbage_min, is_starter
+        )
+
+        def competitive_total(col: str) -> float:
+            return float(self._column(game_log, col)[played] @ comp_ratio)
 
         return FilteredStats(
-            pts_competitive=total_pts,
-            reb_competitive=total_reb,
-            ast_competitive=total_ast,
-            fg3m_competitive=total_fg3m,
-            stl_competitive=total_stl,
-            blk_competitive=total_blk,
-            tov_competitive=total_tov,
-            competitive_minutes=total_comp_min,
-            total_minutes=total_min,
-            garbage_minutes=total_garbage_min,
-            games_with_garbage=games_with_garbage,
+            pts_competitive=competitive_total('PTS'),
+            reb_competitive=competitive_total('REB'),
+            ast_competitive=competitive_total('AST'),
+            fg3m_competitive=competitive_total('FG3M'),
+            stl_competitive=competitive_total('STL'),
+            blk_competitive=competitive_total('BLK'),
+            tov_competitive=competitive_total('TOV'),
+            competitive_minutes=float(competitive_min.sum()),
+            total_minutes=float(minutes.sum()),
+            garbage_minutes=float(garbage_min.sum()),
+            games_with_garbage=int(np.count_nonzero(garbage_min > 0)),
             total_games=len(game_log),
         )
 
@@ -219,60 +191,38 @@ class GarbageTimeFilter:
 
     def _estimate_garbage_minutes(
         self,
-        game: pd.Series,
+        margin: np.ndarray,
         is_starter: bool,
-        total_minutes: float,
-    ) -> float:
-        """Estimate garbage time minutes from game data."""
-
-        # Try to get final margin
-        margin = None
-
-        # PLUS_MINUS at game level approximates team margin
-        if 'PLUS_MINUS' in game.index:
-            pm = self._safe_float(game['PLUS_MINUS'])
-            margin = abs(pm)
-
-        # Or use explicit margin field
-        if margin is None and 'final_margin' in game.index:
-            margin = abs(self._safe_float(game['final_margin']))
-
-        if margin is None or margin < self.BLOWOUT_MARGIN_20:
-            return 0.0
+        total_minutes: np.ndarray,
+    ) -> np.ndarray:
+        """Estimate garbage time minutes per game from final margins."""
+        if not is_starter:
+            # Bench players play MORE in garbage time
+            # Their garbage time contribution is actually their normal time
+            return np.zeros_like(total_minutes)  # Don't filter garbage time for bench players
 
         # Estimate garbage minutes based on margin
-        for threshold in sorted(self.STARTER_GARBAGE_MINUTES.keys(), reverse=True):
-            if margin >= threshold:
-                base_garbage = self.STARTER_GARBAGE_MINUTES[threshold]
-                break
-        else:
-            return 0.0
+        base_garbage = self._GARBAGE_MINUTES[
+            np.searchsorted(self._GARBAGE_THRESHOLDS, margin, side='right')
+        ]
 
-        if is_starter:
-            # Starters play LESS in garbage time
-            # But they may have already been pulled
-            # Cap at a reasonable fraction of their total minutes
-            return min(base_garbage, total_minutes * 0.35)
-        else:
-            # Bench players play MORE in garbage time
-            # Their garbage time contribution is actually their normal time
-            return 0.0  # Don't filter garbage time for bench players
+        # Starters play LESS in garbage time
+        # But they may have already been pulled
+        # Cap at a reasonable fraction of their total minutes
+        return np.minimum(base_garbage, total_minutes * 0.35)
 
     def _estimate_competitive_production_ratio(
         self,
-        total_min: float,
-        comp_min: float,
-        garbage_min: float,
+        comp_min: np.ndarray,
+        garbage_min: np.ndarray,
         is_starter: bool,
-    ) -> float:
+    ) -> np.ndarray:
         """
         Estimate what fraction of stats came during competitive time.
 
         Starters produce at a lower rate in garbage time (often not playing).
+        Games without garbage time keep all of their production.
         """
-        if total_min <= 0:
-            return 1.0
-
         if is_starter:
             # Starter's garbage time minutes have reduced production
             garbage_multiplier = self.GARBAGE_TIME_MULTIPLIER_STARTER
@@ -287,15 +237,23 @@ class GarbageTimeFilter:
         # But garbage time production differs, so:
         # effective_minutes = comp_min + garbage_min * garbage_multiplier
         effective_minutes = comp_min + garbage_min * garbage_multiplier
-        if effective_minutes <= 0:
-            return 1.0
 
         # Ratio of competitive production to total
-        return comp_min / effective_minutes
+        ratio = np.ones_like(comp_min)
+        np.divide(comp_min, effective_minutes, out=ratio,
+                  where=(garbage_min > 0) & (effective_minutes > 0))
+        return ratio
 
-    def _safe_float(self, val) -> float:
-        """Safely convert to float."""
-        try:
-            return float(val) if val is not None and not pd.isna(val) else 0.0
-        except (ValueError, TypeError):
-            return 0.0
+    def _column(self, game_log: pd.DataFrame, col: str) -> np.ndarray:
+        """
+        Pull a column as float64 in one pass.
+
+        Missing columns, missing values and unparseable entries all read as 0.
+        """
+        if col not in game_log.columns:
+            return np.zeros(len(game_log))
+        return (
+            pd.to_numeric(game_log[col], errors='coerce')
+            .fillna(0.0)
+            .to_numpy(dtype=np.float64)
+        )
@@ -12,6 +12,36 @@ from typing import Dict, List, Optional, Tuple
 import numpy as np
 from dataclasses import dataclass, field
 
+from ..jit import njit, prange, HAS_NUMBA
+
+
+@njit('float32[:, :](float64[:, :, :], int32[:], int32[:, :], int32[:, :], float32[:])',
+      cache=True, parallel=True)
+def _lineup_adjustment_kernel(impacts, player_idx, teammates_in, teammates_out, max_adj):
+    """
+    Pairing lookup, in/out sum and per-stat cap for many players in one call.
+
+    Index -1 selects the all-zero sentinel row/column of impacts.
+    """
+    n_players = player_idx.shape[0]
+    n_stats = max_adj.shape[0]
+    out = np.empty((n_players, n_stats), dtype=np.float32)
+    for i in prange(n_players):
+        p = player_idx[i]
+        for s in range(n_stats):
+            acc = np.float32(0.0)
+            for t in teammates_in[i]:
+                acc += np.float32(impacts[p, t, s])
+            for t in teammates_out[i]:
+                acc -= np.float32(impacts[p, t, s])
+            cap = max_adj[s]
+            if acc > cap:
+                acc = cap
+            elif acc < -cap:
+                acc = -cap
+            out[i, s] = acc
+    return out
+
 
 @dataclass
 class LineupContext:
@@ -54,6 +84,11 @@ class LineupAwareProjector:
     # Minimum games together for on/off calculation
     MIN_GAMES_TOGETHER = 10
 
+    # On/off adjustment cache bounds (least recently used evicted first):
+    # distinct on_off_data dicts kept alive, and entries per dict
+    ON_OFF_CACHE_SOURCES = 8
+    ON_OFF_CACHE_SIZE = 4096
+
     # Known high-impact lineup pairings (pre-calculated)
     # Format: (player, teammate) → stat_impacts
     HIGH_IMPACT_PAIRINGS = {
@@ -92,6 +127,104 @@ class LineupAwareProjector:
         },
     }
 
+    # Stats covered by lineup adjustments, in batch column order
+    ADJUSTED_STATS = ('pts', 'reb', 'ast', 'fg3m')
+
+    # Per-stat caps applied by _apply_shrinkage
+    MAX_ADJUSTMENTS = {
+        'pts': 5.0,
+        'reb': 2.5,
+        'ast': 2.0,
+        'fg3m': 1.0,
+    }
+
+    def __init__(self):
+        # id(on_off_data) -> (on_off_data, {(player, teammates_in, teammates_out): adjustments});
+        # both levels are in least-to-most recently used order
+        self._on_off_cache: Dict[int, Tuple[Dict, Dict[tuple, tuple]]] = {}
+
+    def clear_cache(self):
+        """Drop memoized on/off adjustments (call after mutating on_off_data in place)."""
+        self._on_off_cache.clear()
+
+    @classmethod
+    def _build_pairing_tables(cls):
+        """
+        Compile HIGH_IMPACT_PAIRINGS into a dense impact table.
+
+        Runs once at import. _pairing_impacts[p, t, s] is the impact on
+        stat s for player p when teammate t plays. The table has one extra
+        all-zero row/column at index -1, used for padding and for names
+        without known pairings.
+        """
+        names = sorted({name for pair in cls.HIGH_IMPACT_PAIRINGS for name in pair})
+        cls._player_idx = {name: i for i, name in enumerate(names)}
+
+        n = len(names)
+        cls._pairing_impacts = np.zeros((n + 1, n + 1, len(cls.ADJUSTED_STATS)))
+        for (player, teammate), impacts in cls.HIGH_IMPACT_PAIRINGS.items():
+            for s, stat in enumerate(cls.ADJUSTED_STATS):
+                cls._pairing_impacts[cls._player_idx[player], cls._player_idx[teammate], s] = (
+                    impacts.get(stat, 0.0)
+                )
+
+        cls._max_adjustments = np.array(
+            [cls.MAX_ADJUSTMENTS[stat] for stat in cls.ADJUSTED_STATS], dtype=np.float32
+        )
+
+    def _name_indices(self, names: List[str]) -> np.ndarray:
+        """Pairing-table indices for a list of names (-1 for unknown names)."""
+        get = self._player_idx.get
+        return np.fromiter((get(name, -1) for name in names), dtype=np.int32, count=len(names))
+
+    def lineup_indices(self, lineups: List[List[str]]) -> np.ndarray:
+        """
+        Map per-player teammate name lists to a padded int32 index matrix.
+
+        Names without known pairings and padding both map to -1.
+        """
+        width = max((len(names) for names in lineups), default=0)
+        out = np.full((len(lineups), width), -1, dtype=np.int32)
+        for row, names in zip(out, lineups):
+            row[:len(names)] = self._name_indices(names)
+        return out
+
+    def calculate_lineup_adjustment_batch(
+        self,
+        player_names: List[str],
+        teammates_in: np.ndarray,
+        teammates_out: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Known-pairing lineup adjustments for many players at once.
+
+        Batch counterpart of calculate_lineup_adjustment without on/off
+        data: pairing impacts of teammates in, minus those of teammates
+        out, capped per stat.
+
+        Args:
+            player_names: Players being projected (P,)
+            teammates_in: (P, T) int32 teammate indices from lineup_indices
+            teammates_out: (P, T') int32 teammate indices from lineup_indices
+
+        Returns:
+            (P, 4) float32 adjustments, columns ordered as ADJUSTED_STATS
+        """
+        p_idx = self._name_indices(player_names)
+        if HAS_NUMBA:
+            return _lineup_adjustment_kernel(
+                self._pairing_impacts, p_idx,
+                np.ascontiguousarray(teammates_in, dtype=np.int32),
+                np.ascontiguousarray(teammates_out, dtype=np.int32),
+                self._max_adjustments,
+            )
+
+        p_idx = p_idx[:, None]
+        adj = self._pairing_impacts[p_idx, teammates_in].sum(axis=1, dtype=np.float32)
+        adj -= self._pairing_impacts[p_idx, teammates_out].sum(axis=1, dtype=np.float32)
+        np.clip(adj, -self._max_adjustments, self._max_adjustments, out=adj)
+        return adj
+
     def calculate_lineup_adjustment(
         self,
         player_name: str,
@@ -110,49 +243,74 @@ class LineupAwareProjector:
         Returns:
             Dict with stat adjustments: {'pts': X, 'reb': Y, 'ast': Z, 'fg3m': W}
         """
-        adjustments = {'pts': 0.0, 'reb': 0.0, 'ast': 0.0, 'fg3m': 0.0}
-
-        # 1. Check known high-impact pairings
-        for teammate in lineup_context.teammates_in:
-            key = (player_name, teammate)
-            if key in self.HIGH_IMPACT_PAIRINGS:
-                impacts = self.HIGH_IMPACT_PAIRINGS[key]
-                for stat, impact in impacts.items():
-                    if stat in adjustments:
-                        adjustments[stat] += impact
-
-        for teammate in lineup_context.teammates_out:
-            key = (player_name, teammate)
-            if key in self.HIGH_IMPACT_PAIRINGS:
-                # Reverse the impact (teammate is OUT)
-                impacts = self.HIGH_IMPACT_PAIRINGS[key]
-                for stat, impact in impacts.items():
-                    if stat in adjustments:
-                        adjustments[stat] -= impact
+        # Running adjustments, indexed in ADJUSTED_STATS order
+        adj = [0.0, 0.0, 0.0, 0.0]
+
+        # 1. Check known high-impact pairings (most players have none)
+        p = self._player_idx.get(player_name)
+        if p is not None:
+            impacts = self._pairing_impacts[p]
+            vec = impacts[self._name_indices(lineup_context.teammates_in)].sum(axis=0)
+            # Reverse the impact of teammates who are OUT
+            vec -= impacts[self._name_indices(lineup_context.teammates_out)].sum(axis=0)
+            adj = vec.tolist()
 
         # 2. Use on/off splits data if available
         if on_off_data:
-            on_off_adj = self._calculate_on_off_adjustment(
+            on_off_adj = self._cached_on_off_adjustment(
                 player_name, lineup_context, on_off_data
             )
             # Blend with known pairings (on/off data gets 60% weight)
-            for stat in adjustments:
-                if stat in on_off_adj:
-                    known_adj = adjustments[stat]
-                    data_adj = on_off_adj[stat]
-                    if known_adj != 0 and data_adj != 0:
-                        adjustments[stat] = 0.4 * known_adj + 0.6 * data_adj
-                    elif data_adj != 0:
-                        adjustments[stat] = data_adj
+            for s, data_adj in enumerate(on_off_adj):
+                if data_adj != 0:
+                    known_adj = adj[s]
+                    adj[s] = 0.4 * known_adj + 0.6 * data_adj if known_adj != 0 else data_adj
 
         # 3. Apply Bayesian shrinkage to prevent overreaction
-        for stat in adjustments:
-            adjustments[stat] = self._apply_shrinkage(
-                adjustments[stat],
-                stat,
-                lineup_context,
-            )
+        return {
+            stat: self._apply_shrinkage(value, stat, lineup_context)
+            for stat, value in zip(self.ADJUSTED_STATS, adj)
+        }
 
+    def _cached_on_off_adjustment(
+        self,
+        player_name: str,
+        lineup_context: LineupContext,
+        on_off_data: Dict[str, Dict],
+    ) -> Tuple[float, ...]:
+        """
+        Memoized _calculate_on_off_adjustment.
+
+        on_off_data is keyed by identity, so repeated draws for the same
+        matchup reuse the result; the cache keeps a reference to each dict
+        so a recycled id can never alias a different one. At most
+        ON_OFF_CACHE_SOURCES dicts are held, each with a least-recently-used
+        table of up to ON_OFF_CACHE_SIZE entries.
+        """
+        source_id = id(on_off_data)
+        source = self._on_off_cache.pop(source_id, None)
+        if source is None or source[0] is not on_off_data:
+            source = (on_off_data, {})
+            if len(self._on_off_cache) >= self.ON_OFF_CACHE_SOURCES:
+                del self._on_off_cache[next(iter(self._on_off_cache))]
+        # Re-insert so the most recently used source sits last
+        self._on_off_cache[source_id] = source
+
+        entries = source[1]
+        key = (
+            player_name,
+            tuple(lineup_context.teammates_in),
+            tuple(lineup_context.teammates_out),
+        )
+        adjustments = entries.pop(key, None)
+        if adjustments is None:
+            adjustments = tuple(
+                self._calculate_on_off_adjustment(player_name, lineup_context, on_off_data)
+            )
+            if len(entries) >= self.ON_OFF_CACHE_SIZE:
+                # Evict the least recently used entry (dicts keep insertion order)
+                del entries[next(iter(entries))]
+        entries[key] = adjustments
         return adjustments
 
     def _calculate_on_off_adjustment(
@@ -160,10 +318,10 @@ class LineupAwareProjector:
         player_name: str,
         lineup_context: LineupContext,
         on_off_data: Dict[str, Dict],
-    ) -> Dict[str, float]:
-        """Calculate adjustments from on/off splits data."""
+    ) -> List[float]:
+        """Calculate adjustments from on/off splits data, in ADJUSTED_STATS order."""
 
-        adjustments = {'pts': 0.0, 'reb': 0.0, 'ast': 0.0, 'fg3m': 0.0}
+        adjustments = [0.0, 0.0, 0.0, 0.0]
 
         for teammate in lineup_context.teammates_out:
             if teammate in on_off_data:
@@ -175,17 +333,17 @@ class LineupAwareProjector:
 
                 on_stats = data.get('on', {})
                 off_stats = data.get('off', {})
+                # Shrinkage based on sample size (same for every stat)
+                trust = min(minutes / 500, 1.0)
 
                 # The player performs differently with vs without this teammate
                 # When teammate is OUT, we expect the "off" numbers
-                for stat in adjustments:
+                for s, stat in enumerate(self.ADJUSTED_STATS):
                     on_val = on_stats.get(stat, 0)
                     off_val = off_stats.get(stat, 0)
                     if on_val > 0:
                         diff = off_val - on_val
-                        # Apply shrinkage based on sample size
-                        trust = min(minutes / 500, 1.0)
-                        adjustments[stat] += diff * trust
+                        adjustments[s] += diff * trust
 
         for teammate in lineup_context.teammates_in:
             if teammate in on_off_data:
@@ -197,16 +355,17 @@ class LineupAwareProjector:
 
                 on_stats = data.get('on', {})
                 off_stats = data.get('off', {})
+                # Shrinkage based on sample size (same for every stat)
+                trust = min(minutes / 500, 1.0)
 
                 # When teammate is IN, we expect the "on" numbers
                 # Only adjust if player's averages are based on mixed minutes
-                for stat in adjustments:
+                for s, stat in enumerate(self.ADJUSTED_STATS):
                     on_val = on_stats.get(stat, 0)
                     off_val = off_stats.get(stat, 0)
                     if off_val > 0:
                         diff = on_val - off_val
-                        trust = min(minutes / 500, 1.0)
-                        adjustments[stat] += diff * trust * 0.5  # Lower weight for "in"
+                        adjustments[s] += diff * trust * 0.5  # Lower weight for "in"
 
         return adjustments
 
@@ -217,16 +376,14 @@ class LineupAwareProjector:
         lineup_context: LineupContext,
     ) -> float:
         """Apply Bayesian shrinkage to lineup adjustments."""
-        # Cap adjustments at reasonable levels
-        max_adjustments = {
-            'pts': 5.0,
-            'reb': 2.5,
-            'ast': 2.0,
-            'fg3m': 1.0,
-        }
-
-        max_adj = max_adjustments.get(stat, 3.0)
-        return np.clip(adjustment, -max_adj, max_adj)
+        # Cap adjustments at reasonable levels (plain float compare; this
+        # runs per stat per player, where np.clip's scalar overhead dominates)
+        max_adj = self.MAX_ADJUSTMENTS.get(stat, 3.0)
+        if adjustment > max_adj:
+            return max_adj
+        if adjustment < -max_adj:
+            return -max_adj
+        return adjustment
 
     def estimate_starters_bench_split(
         self,
@@ -249,3 +406,25 @@ class LineupAwareProjector:
         bench_min = avg_minutes * (1 - starter_pct)
 
         return starter_min, bench_min
+
+    def estimate_starters_bench_split_batch(
+        self,
+        avg_minutes: np.ndarray,
+        is_starter: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Batch counterpart of estimate_starters_bench_split for a roster.
+
+        Args:
+            avg_minutes: (P,) average minutes per player
+            is_starter: (P,) bool starter flags
+
+        Returns:
+            (starter_minutes, bench_minutes), each (P,)
+        """
+        avg_minutes = np.asarray(avg_minutes, dtype=np.float64)
+        starter_pct = np.where(is_starter, 0.65, 0.35)
+        return avg_minutes * starter_pct, avg_minutes * (1 - starter_pct)
+
+
+LineupAwareProjector._build_pairing_tables()
@@ -1,8 +1,209 @@
-
 from typing import Tuple, List, Dict, Optional
-import pandas as pd
 import numpy as np
 from ..features.player_features import PlayerFeatures
+from ..jit import njit, prange
+
+
+# Historical adjustment factors (calibrated from NBA data); module-level so
+# the compiled kernels below can bake them in as constants
+B2B_ADJUSTMENT = -4.5          # Minutes lost on back-to-backs
+REST_3PLUS_ADJUSTMENT = 2.0    # Extra minutes with 3+ days rest
+BLOWOUT_MINUTES_LOST = -8.0    # Expected minutes lost in blowouts (starters sit)
+FOUL_TROUBLE_ADJUSTMENT = -2.0 # Players averaging 3.5+ fouls/game
+INJURY_REDISTRIBUTION = 0.15   # Multiplier for teammate missing minutes
+
+
+@njit('float64(float64, float64, float64, int64)', cache=True)
+def _base_minutes(minutes_season, minutes_l5, minutes_l10, games_played):
+    """
+    Calculate base minutes using weighted recent performance
+
+    Weights favor recent games for rotation changes
+    """
+    # Handle early season (few games played)
+    if games_played < 5:
+        # Heavy reliance on season average
+        return minutes_season
+    elif games_played < 15:
+        # Blend season and recent
+        return 0.5 * minutes_season + 0.3 * minutes_l5 + 0.2 * minutes_l10
+    # Favor recent games (rotation changes)
+    return 0.35 * minutes_season + 0.40 * minutes_l5 + 0.25 * minutes_l10
+
+
+@njit('float64(float64, float64)', cache=True)
+def _blowout_probability_exact(spread, total):
+    """
+    Estimate probability of blowout (>15 point final margin)
+
+    Uses spread + total to estimate game flow
+    A -12 spread ≈ 35% blowout probability
+    """
+    # Absolute spread magnitude
+    abs_spread = abs(spread)
+
+    # Thresholds (calibrated from historical NBA data)
+    # spread >= 12: ~35% blowout
+    # spread >= 8: ~20% blowout
+    # spread >= 5: ~10% blowout
+    # spread < 5: ~5% blowout
+    # The curve is continuous at 5, 8 and 12, so it is written branch-free
+    # as a sum of clamped linear ramps (slopes 0.01, 0.1/3, 0.0375)
+    base_prob = (
+        0.05
+        + 0.01 * min(abs_spread, 5.0)
+        + (0.10 / 3) * min(max(abs_spread - 5.0, 0.0), 3.0)
+        + 0.0375 * min(max(abs_spread - 8.0, 0.0), 4.0)
+    )
+
+    # Adjust for total (high totals = offensive firepower = more blowout potential)
+    total_mult = 1.15 if total > 230 else (1.05 if total > 220 else (0.90 if total < 210 else 1.0))
+
+    return min(base_prob * total_mult, 0.60)  # Cap at 60%
+
+
+# _blowout_probability_exact tabulated on the half-point grid lines are
+# quoted on: |spread| in [0, 30] and total in [180, 260]
+_BLOWOUT_MAX_SPREAD_HALF = 60
+_BLOWOUT_MIN_TOTAL_HALF = 360
+_BLOWOUT_MAX_TOTAL_HALF = 520
+_BLOWOUT_TABLE = np.array([
+    [_blowout_probability_exact(s / 2, t / 2)
+     for t in range(_BLOWOUT_MIN_TOTAL_HALF, _BLOWOUT_MAX_TOTAL_HALF + 1)]
+    for s in range(_BLOWOUT_MAX_SPREAD_HALF + 1)
+])
+
+
+@njit('float64(float64, float64)', cache=True)
+def _blowout_probability(spread, total):
+    """Blowout probability, read from _BLOWOUT_TABLE for on-grid lines."""
+    spread_half = abs(spread) * 2.0
+    total_half = total * 2.0
+    if (spread_half <= _BLOWOUT_MAX_SPREAD_HALF
+            and _BLOWOUT_MIN_TOTAL_HALF <= total_half <= _BLOWOUT_MAX_TOTAL_HALF):
+        i = int(spread_half)
+        j = int(total_half)
+        if i == spread_half and j == total_half:
+            return _BLOWOUT_TABLE[i, j - _BLOWOUT_MIN_TOTAL_HALF]
+    return _blowout_probability_exact(spread, total)
+
+
+@njit('float64(float64, float64, float64)', cache=True)
+def _fouls_per_game(usage_rate, reb_per_min, minutes_season):
+    """
+    Estimate fouls per game from features
+
+    Rough approximation: usage and minutes correlate with fouls
+    Big men foul more (inferred from rebounding rate)
+    """
+    # Base estimate from league averages by archetype
+    base_fouls = 2.0  # League average starter
+
+    # High-usage players foul more (drawing contact)
+    if usage_rate > 25:
+        base_fouls += 0.5
+
+    # Big men foul more (rim protection, post defense)
+    if reb_per_min > 0.30:
+        base_fouls += 0.8
+
+    # High minutes = more foul opportunities
+    return base_fouls * (minutes_season / 36.0)
+
+
+@njit('float64(float64, float64, float64, boolean)', cache=True)
+def _minutes_std(minutes_std, minutes_season, blowout_prob, is_b2b):
+    """
+    Estimate standard deviation of minutes projection
+
+    Higher variance in:
+    - Blowout games (unpredictable rotation)
+    - Back-to-backs (load management unpredictability)
+    - Players with inconsistent rotations (bench players)
+    """
+    # Base variance from historical data
+    hist_std = minutes_std if minutes_std > 0 else 3.5
+
+    # Blowout uncertainty (huge variance in garbage time)
+    total_mult = 1.0
+    if blowout_prob > 0.3:
+        total_mult *= 1.0 + blowout_prob * 0.8
+
+    # B2B uncertainty (coaches unpredictable with rest)
+    if is_b2b:
+        total_mult *= 1.2
+
+    # Low-minute players have higher variance (rotation uncertainty)
+    if minutes_season < 20:
+        total_mult *= 1.3
+
+    return hist_std * total_mult
+
+
+@njit(
+    'UniTuple(float64, 2)(float64, float64, float64, int64, float64, float64, float64,'
+    ' boolean, int64, float64, boolean, float64, float64, float64)',
+    cache=True,
+)
+def _project_minutes_core(minutes_season, minutes_l5, minutes_l10, games_played,
+                          minutes_std, spread, total, is_b2b, rest_days,
+                          missing_minutes, has_fouls, fouls_per_game,
+                          usage_rate, reb_per_min):
+    """Scalar minutes projection; returns (mean_minutes, std_minutes)."""
+    # 1. Base Minutes Estimate (weighted recent performance)
+    projected = _base_minutes(minutes_season, minutes_l5, minutes_l10, games_played)
+
+    # 2. Back-to-Back Impact
+    if is_b2b:
+        projected += B2B_ADJUSTMENT
+
+    # 3. Rest Days Adjustment
+    if rest_days >= 3:
+        projected += REST_3PLUS_ADJUSTMENT
+
+    # 4. Blowout Risk (most important for minutes)
+    blowout_prob = _blowout_probability(spread, total)
+    projected += blowout_prob * BLOWOUT_MINUTES_LOST
+
+    # 5. Foul Trouble Pattern
+    fpg = fouls_per_game if has_fouls else _fouls_per_game(usage_rate, reb_per_min, minutes_season)
+    if fpg > 3.5:
+        projected += FOUL_TROUBLE_ADJUSTMENT
+
+    # 6. Teammate Injuries (minute redistribution)
+    projected += missing_minutes * INJURY_REDISTRIBUTION
+
+    # 7. Hard caps (can't exceed game length, can't be negative)
+    if projected < 0.0:
+        projected = 0.0
+    elif projected > 48.0:
+        projected = 48.0
+
+    # 8. Variance Estimation
+    return projected, _minutes_std(minutes_std, minutes_season, blowout_prob, is_b2b)
+
+
+@njit(
+    'Tuple((float64[:], float64[:]))(float64[:], float64[:], float64[:], int64[:], float64[:],'
+    ' float64[:], float64[:], boolean[:], int64[:], float64[:], float64[:], float64[:], float64[:])',
+    cache=True, parallel=True,
+)
+def _project_minutes_batch_kernel(minutes_season, minutes_l5, minutes_l10, games_played,
+                                  minutes_std, spread, total, is_b2b, rest_days,
+                                  missing_minutes, fouls_per_game, usage_rate, reb_per_min):
+    """_project_minutes_core over arrays; NaN fouls_per_game means estimate it."""
+    n = minutes_season.shape[0]
+    means = np.empty(n)
+    stds = np.empty(n)
+    for i in prange(n):
+        has_fouls = not np.isnan(fouls_per_game[i])
+        means[i], stds[i] = _project_minutes_core(
+            minutes_season[i], minutes_l5[i], minutes_l10[i], games_played[i],
+            minutes_std[i], spread[i], total[i], is_b2b[i], rest_days[i],
+            missing_minutes[i], has_fouls, fouls_per_game[i] if has_fouls else 0.0,
+            usage_rate[i], reb_per_min[i],
+        )
+    return means, stds
 
 
 class MinutesModel:
@@ -18,12 +219,12 @@ class MinutesModel:
     - Teammate injuries (usage redistribution)
     """
 
-    # Historical adjustment factors (calibrated from NBA data)
-    B2B_ADJUSTMENT = -4.5          # Minutes lost on back-to-backs
-    REST_3PLUS_ADJUSTMENT = 2.0    # Extra minutes with 3+ days rest
-    BLOWOUT_MINUTES_LOST = -8.0    # Expected minutes lost in blowouts (starters sit)
-    FOUL_TROUBLE_ADJUSTMENT = -2.0 # Players averaging 3.5+ fouls/game
-    INJURY_REDISTRIBUTION = 0.15   # Multiplier for teammate missing minutes
+    # Historical adjustment factors (see module constants)
+    B2B_ADJUSTMENT = B2B_ADJUSTMENT
+    REST_3PLUS_ADJUSTMENT = REST_3PLUS_ADJUSTMENT
+    BLOWOUT_MINUTES_LOST = BLOWOUT_MINUTES_LOST
+    FOUL_TROUBLE_ADJUSTMENT = FOUL_TROUBLE_ADJUSTMENT
+    INJURY_REDISTRIBUTION = INJURY_REDISTRIBUTION
 
     def __init__(self):
         """Initialize the minutes model"""
@@ -57,137 +258,77 @@ class MinutesModel:
         Returns:
             Tuple of (mean_minutes, std_minutes)
         """
-        # 1. Base Minutes Estimate (weighted recent performance)
-        base_minutes = self._calculate_base_minutes(features)
-
-        # 2. Initialize adjustment tracker
-        adjustments = {}
-
-        # 3. Back-to-Back Impact
-        if is_b2b:
-            adjustments['back_to_back'] = self.B2B_ADJUSTMENT
-
-        # 4. Rest Days Adjustment
-        if rest_days >= 3:
-            adjustments['rest_3plus'] = self.REST_3PLUS_ADJUSTMENT
-
-        # 5. Blowout Risk (most important for minutes)
-        blowout_prob = self._estimate_blowout_probability(spread, total)
-        adjustments['blowout_risk'] = blowout_prob * self.BLOWOUT_MINUTES_LOST
-
-        # 6. Foul Trouble Pattern
-        fpg = fouls_per_game if fouls_per_game is not None else self._estimate_fouls_per_game(features)
-        if fpg > 3.5:
-            adjustments['foul_trouble'] = self.FOUL_TROUBLE_ADJUSTMENT
-
-        # 7. Teammate Injuries (minute redistribution)
+        missing_minutes = 0.0
         if teammate_injuries:
             missing_minutes = self._sum_missing_teammate_minutes(
                 teammate_injuries,
                 features.team
             )
-            adjustments['teammate_injuries'] = missing_minutes * self.INJURY_REDISTRIBUTION
-
-        # 8. Apply all adjustments
-        total_adjustment = sum(adjustments.values())
-        projected_minutes = base_minutes + total_adjustment
 
-        # 9. Hard caps (can't exceed game length, can't be negative)
-        projected_minutes = min(max(projected_minutes, 0.0), 48.0)
-
-        # 10. Variance Estimation
-        std_minutes = self._estimate_minutes_variance(
-            features,
-            blowout_prob,
-            is_b2b
+        return _project_minutes_core(
+            float(features.minutes_season),
+            float(features.minutes_l5),
+            float(features.minutes_l10),
+            int(features.games_played),
+            float(features.minutes_std),
+            float(spread),
+            float(total),
+            bool(is_b2b),
+            int(rest_days),
+            float(missing_minutes),
+            fouls_per_game is not None,
+            float(fouls_per_game) if fouls_per_game is not None else 0.0,
+            float(features.usage_rate),
+            float(features.reb_per_min),
         )
 
-        return projected_minutes, std_minutes
-
-    def _calculate_base_minutes(self, features: PlayerFeatures) -> float:
-        """
-        Calculate base minutes using weighted recent performance
-
-        Weights favor recent games for rotation changes
-        """
-        # Handle early season (few games played)
-        if features.games_played < 5:
-            # Heavy reliance on season average
-            return features.minutes_season
-        elif features.games_played < 15:
-            # Blend season and recent
-            return (
-                0.5 * features.minutes_season +
-                0.3 * features.minutes_l5 +
-                0.2 * features.minutes_l10
-            )
-        else:
-            # Favor recent games (rotation changes)
-            return (
-                0.35 * features.minutes_season +
-                0.40 * features.minutes_l5 +
-                0.25 * features.minutes_l10
-            )
-
-    def _estimate_blowout_probability(self, spread: float, total: float) -> float:
+    def project_minutes_batch(
+        self,
+        minutes_season: np.ndarray,
+        minutes_l5: np.ndarray,
+        minutes_l10: np.ndarray,
+        games_played: np.ndarray,
+        minutes_std: np.ndarray,
+        usage_rate: np.ndarray,
+        reb_per_min: np.ndarray,
+        spread: np.ndarray,
+        total: np.ndarray = 225.0,
+        is_b2b: np.ndarray = False,
+        rest_days: np.ndarray = 1,
+        missing_minutes: np.ndarray = 0.0,
+        fouls_per_game: np.ndarray = np.nan,
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Estimate probability of blowout (>15 point final margin)
+        Project minutes for a whole slate in one call.
 
-        Uses spread + total to estimate game flow
-        A -12 spread ≈ 35% blowout probability
-        """
-        # Absolute spread magnitude
-        abs_spread = abs(spread)
-
-        # Thresholds (calibrated from historical NBA data)
-        # spread >= 12: ~35% blowout
-        # spread >= 8: ~20% blowout
-        # spread >= 5: ~10% blowout
-        # spread < 5: ~5% blowout
-
-        if abs_spread >= 12:
-            base_prob = 0.35
-        elif abs_spread >= 8:
-            base_prob = 0.20 + (abs_spread - 8) / 4 * 0.15
-        elif abs_spread >= 5:
-            base_prob = 0.10 + (abs_spread - 5) / 3 * 0.10
-        else:
-            base_prob = 0.05 + abs_spread / 5 * 0.05
-
-        # Adjust for total (high totals = offensive firepower = more blowout potential)
-        if total > 230:
-            total_mult = 1.15
-        elif total > 220:
-            total_mult = 1.05
-        elif total < 210:
-            total_mult = 0.90
-        else:
-            total_mult = 1.0
-
-        return min(base_prob * total_mult, 0.60)  # Cap at 60%
-
-    def _estimate_fouls_per_game(self, features: PlayerFeatures) -> float:
-        """
-        Estimate fouls per game from features
+        Every argument is a per-player 1-D array (scalars broadcast), with
+        the same meaning as in project_minutes; missing_minutes is the
+        summed minutes of injured teammates and a NaN fouls_per_game is
+        estimated from the player's features.
 
-        Rough approximation: usage and minutes correlate with fouls
-        Big men foul more (inferred from rebounding rate)
+        Returns:
+            Tuple of (mean_minutes, std_minutes) arrays
         """
-        # Base estimate from league averages by archetype
-        base_fouls = 2.0  # League average starter
-
-        # High-usage players foul more (drawing contact)
-        if features.usage_rate > 25:
-            base_fouls += 0.5
-
-        # Big men foul more (rim protection, post defense)
-        if features.reb_per_min > 0.30:
-            base_fouls += 0.8
-
-        # High minutes = more foul opportunities
-        minutes_factor = features.minutes_season / 36.0
+        (minutes_season, minutes_l5, minutes_l10, games_played, minutes_std,
+         usage_rate, reb_per_min, spread, total, is_b2b, rest_days,
+         missing_minutes, fouls_per_game) = np.broadcast_arrays(
+            minutes_season, minutes_l5, minutes_l10, games_played, minutes_std,
+            usage_rate, reb_per_min, spread, total, is_b2b, rest_days,
+            missing_minutes, fouls_per_game,
+        )
 
-        return base_fouls * minutes_factor
+        def f64(a):
+            return np.ascontiguousarray(a, dtype=np.float64).ravel()
+
+        return _project_minutes_batch_kernel(
+            f64(minutes_season), f64(minutes_l5), f64(minutes_l10),
+            np.ascontiguousarray(games_played, dtype=np.int64).ravel(),
+            f64(minutes_std), f64(spread), f64(total),
+            np.ascontiguousarray(is_b2b, dtype=np.bool_).ravel(),
+            np.ascontiguousarray(rest_days, dtype=np.int64).ravel(),
+            f64(missing_minutes), f64(fouls_per_game),
+            f64(usage_rate), f64(reb_per_min),
+        )
 
     def _sum_missing_teammate_minutes(
         self,
@@ -202,43 +343,6 @@ class MinutesModel:
             
         return sum(injured_teammates.values())
 
-    def _estimate_minutes_variance(
-        self,
-        features: PlayerFeatures,
-        blowout_prob: float,
-        is_b2b: bool
-    ) -> float:
-        """
-        Estimate standard deviation of minutes projection
-
-        Higher variance in:
-        - Blowout games (unpredictable rotation)
-        - Back-to-backs (load management unpredictability)
-        - Players with inconsistent rotations (bench players)
-        """
-        # Base variance from historical data
-        hist_std = features.minutes_std if features.minutes_std > 0 else 3.5
-
-        # Multipliers for uncertainty
-        multipliers = []
-
-        # Blowout uncertainty (huge variance in garbage time)
-        if blowout_prob > 0.3:
-            multipliers.append(1.0 + blowout_prob * 0.8)
-
-        # B2B uncertainty (coaches unpredictable with rest)
-        if is_b2b:
-            multipliers.append(1.2)
-
-        # Low-minute players have higher variance (rotation uncertainty)
-        if features.minutes_season < 20:
-            multipliers.append(1.3)
-
-        # Combine multipliers
-        total_mult = np.prod(multipliers) if multipliers else 1.0
-
-        return hist_std * total_mult
-
     def set_injury_impact_cache(self, cache: Dict[str, Dict[str, Dict[str, float]]]):
         """
         Set the injury impact cache for usage redistribution
@@ -12,8 +12,48 @@ from typing import Dict, Tuple, Optional
 import numpy as np
 from dataclasses import dataclass
 
+from ..jit import njit, prange, HAS_NUMBA
 
-@dataclass
+# League average pace (possessions per 48 minutes)
+LEAGUE_AVG_PACE = 100.0
+
+# Share of the two teams' average pace kept when projecting game pace;
+# the rest regresses to the league average
+GAME_PACE_REGRESSION = 0.85
+
+
+@njit('float64(float64, float64, float64, float64)', cache=True)
+def _project_pace_adjusted(per_min, projected_minutes, team_pace, opponent_pace):
+    """
+    Fused calculate_game_pace -> per-100 conversion -> project_stat_with_pace.
+
+    per_min * 48 * (100 / team_pace) * (minutes / 48) * (game_pace / 100)
+    collapses to per_min * minutes * game_pace / team_pace.
+    """
+    if team_pace <= 0:
+        team_pace = LEAGUE_AVG_PACE
+    if opponent_pace <= 0:
+        opponent_pace = LEAGUE_AVG_PACE
+    game_pace = (GAME_PACE_REGRESSION * (team_pace + opponent_pace) / 2
+                 + (1 - GAME_PACE_REGRESSION) * LEAGUE_AVG_PACE)
+    return per_min * projected_minutes * game_pace / team_pace
+
+
+@njit('float64[:, :](float64[:, :], float64[:], float64[:], float64[:])',
+      cache=True, parallel=True)
+def _project_pace_adjusted_batch(per_min, projected_minutes, team_pace, opponent_pace):
+    """_project_pace_adjusted for (players, stats) rates in one pass."""
+    n_players, n_stats = per_min.shape
+    out = np.empty((n_players, n_stats))
+    for i in prange(n_players):
+        # Per-player scale is the fused kernel evaluated at a unit rate
+        scale = _project_pace_adjusted(1.0, projected_minutes[i], team_pace[i], opponent_pace[i])
+        for k in range(n_stats):
+            out[i, k] = per_min[i, k] * scale
+    return out
+
+
+@dataclass(slots=True, frozen=True)
 class PaceAdjustedRates:
     """Container for pace-adjusted per-100-possession rates."""
     pts_per_100: float = 0.0
@@ -26,6 +66,20 @@ class PaceAdjustedRates:
     team_pace: float = 100.0  # Pace the rates were calculated at
 
 
+# One record per player: the PaceAdjustedRates fields in float32, for
+# slate-scale processing without a Python object per player
+PACE_DTYPE = np.dtype([
+    ('pts_per_100', 'f4'),
+    ('reb_per_100', 'f4'),
+    ('ast_per_100', 'f4'),
+    ('fg3m_per_100', 'f4'),
+    ('stl_per_100', 'f4'),
+    ('blk_per_100', 'f4'),
+    ('tov_per_100', 'f4'),
+    ('team_pace', 'f4'),
+])
+
+
 class PaceAdjuster:
     """
     Converts raw per-minute rates to pace-adjusted per-100-possession rates,
@@ -33,10 +87,18 @@ class PaceAdjuster:
     """
 
     # League average pace (possessions per 48 minutes)
-    LEAGUE_AVG_PACE = 100.0
+    LEAGUE_AVG_PACE = LEAGUE_AVG_PACE
 
     # Minutes per game assumed for per-48 conversion
     MINUTES_PER_GAME = 48.0
+    _INV_MIN_PER_GAME = 1.0 / MINUTES_PER_GAME
+
+    # Folded conversion constants: per-100 factor numerator and 1 / league pace
+    _MIN_X_PACE = MINUTES_PER_GAME * LEAGUE_AVG_PACE
+    _INV_PACE = 1.0 / LEAGUE_AVG_PACE
+
+    # Column layout of the (players, 7) rate arrays used by the batch methods
+    STAT_COLS = {'pts': 0, 'reb': 1, 'ast': 2, 'fg3m': 3, 'stl': 4, 'blk': 5, 'tov': 6}
 
     def calculate_pace_adjusted_rates(
         self,
@@ -62,7 +124,7 @@ class PaceAdjuster:
         if team_pace <= 0:
             team_pace = self.LEAGUE_AVG_PACE
 
-        conversion_factor = self.MINUTES_PER_GAME * (self.LEAGUE_AVG_PACE / team_pace)
+        conversion_factor = self._MIN_X_PACE / team_pace
 
         return PaceAdjustedRates(
             pts_per_100=pts_per_min * conversion_factor,
@@ -75,6 +137,47 @@ class PaceAdjuster:
             team_pace=team_pace,
         )
 
+    def calculate_pace_adjusted_rates_batch(
+        self,
+        per_min: np.ndarray,
+        team_pace: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Batch form of calculate_pace_adjusted_rates.
+
+        Args:
+            per_min: (players, 7) per-minute rates, columns as STAT_COLS
+            team_pace: (players,) team pace; non-positive means league average
+
+        Returns:
+            (players, 7) per-100-possession rates
+        """
+        team_pace = np.asarray(team_pace, dtype=np.float64)
+        team_pace = np.where(team_pace <= 0, self.LEAGUE_AVG_PACE, team_pace)
+        conversion_factor = self._MIN_X_PACE / team_pace
+        return np.asarray(per_min, dtype=np.float64) * conversion_factor[:, None]
+
+    def calculate_pace_adjusted_rates_records(
+        self,
+        per_min: np.ndarray,
+        team_pace: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Batch form of calculate_pace_adjusted_rates as PACE_DTYPE records.
+
+        Same inputs as calculate_pace_adjusted_rates_batch; returns a
+        (players,) structured array with the PaceAdjustedRates fields.
+        """
+        team_pace = np.asarray(team_pace, dtype=np.float64)
+        team_pace = np.where(team_pace <= 0, self.LEAGUE_AVG_PACE, team_pace)
+        rates = self.calculate_pace_adjusted_rates_batch(per_min, team_pace)
+
+        out = np.empty(len(team_pace), dtype=PACE_DTYPE)
+        for stat, col in self.STAT_COLS.items():
+            out[f'{stat}_per_100'] = rates[:, col]
+        out['team_pace'] = team_pace
+        return out
+
     def project_stat_with_pace(
         self,
         per_100_rate: float,
@@ -89,11 +192,39 @@ class PaceAdjuster:
         if projected_game_pace <= 0:
             projected_game_pace = self.LEAGUE_AVG_PACE
 
-        minutes_fraction = projected_minutes / self.MINUTES_PER_GAME
-        pace_factor = projected_game_pace / self.LEAGUE_AVG_PACE
+        minutes_fraction = projected_minutes * self._INV_MIN_PER_GAME
+        if projected_game_pace == self.LEAGUE_AVG_PACE:
+            # Common case (pace unknown/defaulted): pace factor is exactly 1
+            return per_100_rate * minutes_fraction
+
+        pace_factor = projected_game_pace * self._INV_PACE
 
         return per_100_rate * minutes_fraction * pace_factor
 
+    def project_stat_with_pace_batch(
+        self,
+        per_100_rates: np.ndarray,
+        projected_minutes: np.ndarray,
+        projected_game_pace: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Batch form of project_stat_with_pace.
+
+        per_100_rates is (players,) for one stat or (players, 7) with
+        columns as STAT_COLS; minutes and game pace are per player.
+        """
+        per_100_rates = np.asarray(per_100_rates, dtype=np.float64)
+        projected_game_pace = np.asarray(projected_game_pace, dtype=np.float64)
+        projected_game_pace = np.where(
+            projected_game_pace <= 0, self.LEAGUE_AVG_PACE, projected_game_pace
+        )
+
+        minutes_fraction = np.asarray(projected_minutes, dtype=np.float64) * self._INV_MIN_PER_GAME
+        factor = minutes_fraction * (projected_game_pace * self._INV_PACE)
+        if per_100_rates.ndim == 2:
+            factor = factor[:, None]
+        return per_100_rates * factor
+
     def calculate_game_pace(
         self,
         team_pace: float,
@@ -115,7 +246,7 @@ class PaceAdjuster:
         raw_avg = (team_pace + opponent_pace) / 2
 
         # Regress 15% toward league average (game pace is more stable than team pace)
-        regression_factor = 0.85
+        regression_factor = GAME_PACE_REGRESSION
         projected = regression_factor * raw_avg + (1 - regression_factor) * self.LEAGUE_AVG_PACE
 
         return projected
@@ -132,4 +263,54 @@ class PaceAdjuster:
         Useful as a quick adjustment without full per-100 conversion.
         """
         game_pace = self.calculate_game_pace(team_pace, opponent_pace)
-        return game_pace / self.LEAGUE_AVG_PACE
+        return game_pace * self._INV_PACE
+
+    def project_pace_adjusted(
+        self,
+        per_min: float,
+        projected_minutes: float,
+        team_pace: float,
+        opponent_pace: float,
+    ) -> float:
+        """
+        Project a raw stat from a per-minute rate in one step.
+
+        Equivalent to calculate_game_pace, the per-100 conversion at
+        team_pace and project_stat_with_pace, without the intermediates.
+        """
+        return _project_pace_adjusted(
+            float(per_min), float(projected_minutes), float(team_pace), float(opponent_pace)
+        )
+
+    def project_pace_adjusted_batch(
+        self,
+        per_min: np.ndarray,
+        projected_minutes: np.ndarray,
+        team_pace: np.ndarray,
+        opponent_pace: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Batch form of project_pace_adjusted.
+
+        per_min is (players,) for one stat or (players, 7) with columns as
+        STAT_COLS; minutes and paces are per player. Returns the same shape.
+        """
+        per_min = np.asarray(per_min, dtype=np.float64)
+        rates = per_min[:, None] if per_min.ndim == 1 else per_min
+        projected_minutes, team_pace, opponent_pace = (
+            np.ascontiguousarray(a, dtype=np.float64)
+            for a in (projected_minutes, team_pace, opponent_pace)
+        )
+
+        if HAS_NUMBA:
+            out = _project_pace_adjusted_batch(
+                np.ascontiguousarray(rates), projected_minutes, team_pace, opponent_pace
+            )
+        else:
+            team_pace = np.where(team_pace <= 0, LEAGUE_AVG_PACE, team_pace)
+            opponent_pace = np.where(opponent_pace <= 0, LEAGUE_AVG_PACE, opponent_pace)
+            game_pace = (GAME_PACE_REGRESSION * (team_pace + opponent_pace) / 2
+                         + (1 - GAME_PACE_REGRESSION) * LEAGUE_AVG_PACE)
+            out = rates * (projected_minutes * game_pace / team_pace)[:, None]
+
+        return out.reshape(per_min.shape)
@@ -12,22 +12,122 @@ These are simple, high-impact rules based on known systematic biases:
 
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
+from enum import IntEnum
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+class RejectionCode(IntEnum):
+    """Why a pick was rejected (0 = not rejected)."""
+    NONE = 0
+    LOW_MINUTES = 1
+    SMALL_SAMPLE = 2
+
+
+_REJECTION_FORMATS = {
+    RejectionCode.LOW_MINUTES: "Low minutes ({:.1f} mpg < {})",
+    RejectionCode.SMALL_SAMPLE: "Small sample ({} games < {})",
+}
+
+
+@dataclass(slots=True, init=False)
 class PickQualityResult:
     """Result of quality filter evaluation."""
     passes: bool
-    rejection_reason: Optional[str] = None
-    quality_score: float = 1.0  # 0-1, higher = better quality pick
-    adjustments: Dict[str, float] = field(default_factory=dict)
-    warnings: List[str] = field(default_factory=list)
-
+    quality_score: float  # 0-1, higher = better quality pick
+    adjustments: Dict[str, float]
+    warnings: List[str]
+    rejection_code: RejectionCode
+    # (observed value, threshold) behind the rejection, formatted on demand
+    rejection_args: Tuple[Any, ...]
+    # Explicit message passed as rejection_reason=, overrides the formatted one
+    _rejection_message: Optional[str] = field(repr=False)
+
+    def __init__(
+        self,
+        passes: bool,
+        rejection_reason: Optional[str] = None,
+        quality_score: float = 1.0,
+        adjustments: Optional[Dict[str, float]] = None,
+        warnings: Optional[List[str]] = None,
+        rejection_code: RejectionCode = RejectionCode.NONE,
+        rejection_args: Tuple[Any, ...] = (),
+    ):
+        self.passes = passes
+        self.quality_score = quality_score
+        self.adjustments = {} if adjustments is None else adjustments
+        self.warnings = [] if warnings is None else warnings
+        self.rejection_code = rejection_code
+        self.rejection_args = rejection_args
+        self._rejection_message = rejection_reason
 
-@dataclass
+    @property
+    def rejection_reason(self) -> Optional[str]:
+        """Human-readable rejection message (formatted when read)."""
+        if self._rejection_message is not None:
+            return self._rejection_message
+        if self.rejection_code == RejectionCode.NONE:
+            return None
+        return _REJECTION_FORMATS[self.rejection_code].format(*self.rejection_args)
+
+    @rejection_reason.setter
+    def rejection_reason(self, message: Optional[str]):
+        self._rejection_message = message
+
+
+class StatType(IntEnum):
+    """Integer codes for prop stat types (context['stat_type_code'])."""
+    OTHER = 0
+    POINTS = 1
+    REBOUNDS = 2
+    ASSISTS = 3
+    THREES = 4
+    PRA = 5
+    PTS_REB = 6
+    PTS_AST = 7
+    REB_AST = 8
+    STEALS = 9
+    BLOCKS = 10
+    TURNOVERS = 11
+    BLK_STL = 12
+
+
+STAT_TYPE_CODES: Dict[str, StatType] = {
+    'Points': StatType.POINTS,
+    'Rebounds': StatType.REBOUNDS,
+    'Assists': StatType.ASSISTS,
+    '3-Pointers Made': StatType.THREES,
+    'Pts+Rebs+Asts': StatType.PRA,
+    'Pts+Rebs': StatType.PTS_REB,
+    'Pts+Asts': StatType.PTS_AST,
+    'Rebs+Asts': StatType.REB_AST,
+    'Steals': StatType.STEALS,
+    'Blocks': StatType.BLOCKS,
+    'Turnovers': StatType.TURNOVERS,
+    'Blks+Stls': StatType.BLK_STL,
+}
+
+# Stat types where a low-volume scorer adds variance, as a bitmask of codes
+SCORING_STAT_MASK = (1 << StatType.POINTS) | (1 << StatType.PRA)
+
+
+def stat_type_code(context: Dict[str, Any]) -> int:
+    """StatType code of a pick: context['stat_type_code'], else mapped from 'stat_type'."""
+    code = context.get('stat_type_code')
+    if code is None:
+        code = STAT_TYPE_CODES.get(context.get('stat_type'), StatType.OTHER)
+    return int(code)
+
+
+# A signal counts as profitable after this many bets at better than this ROI
+MIN_PROFITABLE_BETS = 20
+MIN_PROFITABLE_ROI = -0.02
+
+
+@dataclass(slots=True)
 class SignalROI:
     """Tracked ROI for a signal."""
     signal_name: str
@@ -51,7 +151,7 @@ class SignalROI:
 
     @property
     def is_profitable(self) -> bool:
-        return self.total_bets >= 20 and self.roi > -0.02
+        return self.total_bets >= MIN_PROFITABLE_BETS and self.roi > MIN_PROFITABLE_ROI
 
 
 class PickQualityFilter:
@@ -80,9 +180,23 @@ class PickQualityFilter:
     # Minimum confidence to recommend
     MIN_CONFIDENCE = 0.45
 
+    # Initial row capacity of the ROI table (doubles when full)
+    _ROI_INITIAL_CAPACITY = 64
+
     def __init__(self):
         """Initialize filter with ROI tracking."""
-        self._signal_roi: Dict[str, Dict[str, SignalROI]] = {}
+        # ROI table as parallel arrays; (stat_type, signal_name) -> row
+        self._roi_rows: Dict[Tuple[str, str], int] = {}
+        self._total_bets = np.zeros(self._ROI_INITIAL_CAPACITY, dtype=np.int64)
+        self._wins = np.zeros(self._ROI_INITIAL_CAPACITY, dtype=np.int64)
+        self._total_profit = np.zeros(self._ROI_INITIAL_CAPACITY, dtype=np.float64)
+        # Derived columns, maintained by record_outcome so readers never recompute
+        self._roi = np.zeros(self._ROI_INITIAL_CAPACITY, dtype=np.float64)
+        self._profitable = np.zeros(self._ROI_INITIAL_CAPACITY, dtype=bool)
+
+        # Signal order of the last base_weights seen by get_adjusted_weights
+        self._weight_keys: Tuple[str, ...] = ()
+        self._weight_index: Dict[str, int] = {}
 
     def evaluate_pick(
         self,
@@ -113,7 +227,8 @@ class PickQualityFilter:
         if avg_minutes < self.MIN_MINUTES_THRESHOLD:
             return PickQualityResult(
                 passes=False,
-                rejection_reason=f"Low minutes ({avg_minutes:.1f} mpg < {self.MIN_MINUTES_THRESHOLD})",
+                rejection_code=RejectionCode.LOW_MINUTES,
+                rejection_args=(avg_minutes, self.MIN_MINUTES_THRESHOLD),
                 quality_score=0.2,
             )
 
@@ -122,7 +237,8 @@ class PickQualityFilter:
         if games_played < self.MIN_GAMES_THRESHOLD:
             return PickQualityResult(
                 passes=False,
-                rejection_reason=f"Small sample ({games_played} games < {self.MIN_GAMES_THRESHOLD})",
+                rejection_code=RejectionCode.SMALL_SAMPLE,
+                rejection_args=(games_played, self.MIN_GAMES_THRESHOLD),
                 quality_score=0.3,
             )
 
@@ -135,43 +251,50 @@ class PickQualityFilter:
                 quality_score *= 0.7
                 warnings.append(f"High minutes variance (CV={minutes_cv:.2f})")
 
+        # Names of fired signals, introspected once for all adjustments below
+        fired_signals = [name for name, result in (signal_results or {}).items()
+                         if getattr(result, 'fired', False)]
+
         # Adjustment 1: Boost injury signal weight
-        if signal_results:
-            injury_result = signal_results.get('injury_alpha')
-            if injury_result and hasattr(injury_result, 'fired') and injury_result.fired:
-                # Our best signal - boost its impact
-                adjustments['injury_alpha_boost'] = self.INJURY_SIGNAL_BOOST
-                quality_score = min(quality_score * 1.15, 1.0)
+        if 'injury_alpha' in fired_signals:
+            # Our best signal - boost its impact
+            adjustments['injury_alpha_boost'] = self.INJURY_SIGNAL_BOOST
+            quality_score = min(quality_score * 1.15, 1.0)
 
         # Adjustment 2: Penalize signals with negative ROI
-        if signal_results:
+        if signal_results and self._roi_rows:
             stat_type = context.get('stat_type', 'Points')
-            for signal_name, result in signal_results.items():
-                if not hasattr(result, 'fired') or not result.fired:
-                    continue
+            rows = np.fromiter(
+                (self._roi_rows.get((stat_type, name), -1) for name in fired_signals),
+                dtype=np.int64, count=len(fired_signals),
+            )
+            tracked = rows >= 0
+            roi, profitable = self._roi_stats(rows[tracked])
 
-                roi_data = self._get_signal_roi(signal_name, stat_type)
-                if roi_data and not roi_data.is_profitable:
+            for signal_name, signal_roi, ok in zip(
+                np.array(fired_signals, dtype=object)[tracked], roi.tolist(), profitable.tolist()
+            ):
+                if not ok:
                     adjustments[f'{signal_name}_penalty'] = self.SIGNAL_PENALTY_FACTOR
-                    warnings.append(f"Signal '{signal_name}' has negative ROI ({roi_data.roi:.1%})")
+                    warnings.append(f"Signal '{signal_name}' has negative ROI ({signal_roi:.1%})")
                     quality_score *= 0.9
 
         # Adjustment 3: Low-scoring players with counting stats have higher variance
         pts_avg = season_avgs.get('pts', 0)
-        if pts_avg < 10 and context.get('stat_type') in ('Points', 'Pts+Rebs+Asts'):
+        code = stat_type_code(context)
+        if pts_avg < 10 and (1 << code) & SCORING_STAT_MASK:
             quality_score *= 0.8
             warnings.append("Low-volume scorer (high variance)")
 
         # Adjustment 4: 3PM for non-shooters
         fg3a = season_avgs.get('fg3a', 0)
-        if context.get('stat_type') == '3-Pointers Made' and fg3a < 3.0:
+        if code == StatType.THREES and fg3a < 3.0:
             quality_score *= 0.7
             warnings.append("Low 3PA volume (< 3.0 per game)")
 
         # Adjustment 5: Extra trust in games with many fired signals
         if signal_results:
-            fired_count = sum(1 for r in signal_results.values()
-                            if hasattr(r, 'fired') and r.fired)
+            fired_count = len(fired_signals)
             if fired_count >= 4:
                 quality_score = min(quality_score * 1.1, 1.0)
             elif fired_count <= 1:
@@ -185,6 +308,98 @@ class PickQualityFilter:
             warnings=warnings,
         )
 
+    def evaluate_batch(
+        self,
+        contexts: List[Dict[str, Any]],
+        signal_results_list: Optional[List[Optional[Dict[str, Any]]]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Vectorized evaluate_pick over a slate of picks.
+
+        Applies the same filters and quality adjustments as evaluate_pick,
+        column-wise over all picks. Adjustment dicts and warnings are not
+        built; call evaluate_pick for a single pick's details.
+
+        Args:
+            contexts: Context dict per pick
+            signal_results_list: Signal results per pick (or None)
+
+        Returns:
+            (passes, quality_score, rejection_codes): bool, float64 and
+            int8 arrays of shape (n,); rejection_codes holds RejectionCode
+            values (NONE for picks that pass)
+        """
+        n = len(contexts)
+        if signal_results_list is None:
+            signal_results_list = [None] * n
+
+        season_avgs = [ctx.get('season_averages', {}) for ctx in contexts]
+        avg_minutes = np.array([ctx.get('avg_minutes', 0) for ctx in contexts], dtype=np.float64)
+        season_min = np.array([sa.get('min', 0) for sa in season_avgs], dtype=np.float64)
+        avg_minutes = np.where(avg_minutes <= 0, season_min, avg_minutes)
+        games_played = np.array([ctx.get('games_played', 0) for ctx in contexts], dtype=np.float64)
+        minutes_std = np.array([ctx.get('minutes_std', 0) for ctx in contexts], dtype=np.float64)
+        pts_avg = np.array([sa.get('pts', 0) for sa in season_avgs], dtype=np.float64)
+        fg3a = np.array([sa.get('fg3a', 0) for sa in season_avgs], dtype=np.float64)
+        codes = np.fromiter((stat_type_code(ctx) for ctx in contexts), dtype=np.int64, count=n)
+        is_pts_stat = ((1 << codes) & SCORING_STAT_MASK) != 0
+        is_3pm_stat = codes == StatType.THREES
+
+        # Filters 1-2
+        low_minutes = avg_minutes < self.MIN_MINUTES_THRESHOLD
+        small_sample = ~low_minutes & (games_played < self.MIN_GAMES_THRESHOLD)
+        passes = ~(low_minutes | small_sample)
+
+        # Per-pick signal summaries; ROI rows of all fired signals are
+        # looked up in one flat pass and reduced per pick with bincount
+        has_signals = np.array([bool(sr) for sr in signal_results_list], dtype=bool)
+        injury_fired = np.zeros(n, dtype=bool)
+        fired_count = np.zeros(n, dtype=np.int64)
+        pick_of_row: List[int] = []
+        roi_rows: List[int] = []
+        for i, sr in enumerate(signal_results_list):
+            if not sr:
+                continue
+            stat_type = contexts[i].get('stat_type', 'Points')
+            fired_signals = [name for name, result in sr.items()
+                             if getattr(result, 'fired', False)]
+            injury_fired[i] = 'injury_alpha' in fired_signals
+            fired_count[i] = len(fired_signals)
+            for name in fired_signals:
+                row = self._roi_rows.get((stat_type, name))
+                if row is not None:
+                    pick_of_row.append(i)
+                    roi_rows.append(row)
+        _, profitable = self._roi_stats(np.array(roi_rows, dtype=np.int64))
+        n_unprofitable = np.bincount(
+            np.array(pick_of_row, dtype=np.int64)[~profitable], minlength=n
+        )
+
+        # Quality adjustments, applied in evaluate_pick's order
+        quality = np.ones(n)
+        # CV stays 0 where avg_minutes <= 0; std <= 0 gives CV <= 0 on its own
+        minutes_cv = np.zeros(n)
+        np.divide(minutes_std, avg_minutes, out=minutes_cv, where=avg_minutes > 0)
+        quality *= np.where(minutes_cv > 0.30, 0.7, 1.0)
+        quality = np.where(injury_fired, np.minimum(quality * 1.15, 1.0), quality)
+        for k in range(n_unprofitable.max(initial=0)):
+            quality = np.where(n_unprofitable > k, quality * 0.9, quality)
+        quality *= np.where(is_pts_stat & (pts_avg < 10), 0.8, 1.0)
+        quality *= np.where(is_3pm_stat & (fg3a < 3.0), 0.7, 1.0)
+        quality = np.where(
+            has_signals & (fired_count >= 4), np.minimum(quality * 1.1, 1.0),
+            np.where(has_signals & (fired_count <= 1), quality * 0.9, quality),
+        )
+
+        quality[low_minutes] = 0.2
+        quality[small_sample] = 0.3
+
+        rejection_codes = np.zeros(n, dtype=np.int8)
+        rejection_codes[low_minutes] = RejectionCode.LOW_MINUTES
+        rejection_codes[small_sample] = RejectionCode.SMALL_SAMPLE
+
+        return passes, quality, rejection_codes
+
     def get_adjusted_weights(
         self,
         base_weights: Dict[str, float],
@@ -200,24 +415,29 @@ class PickQualityFilter:
         Returns:
             Adjusted weights dict
         """
-        adjusted = base_weights.copy()
+        keys = tuple(base_weights)
+        if keys != self._weight_keys:
+            self._weight_keys = keys
+            self._weight_index = {k: i for i, k in enumerate(keys)}
+        weights = np.fromiter(base_weights.values(), dtype=np.float64, count=len(keys))
 
         for adj_key, adj_value in quality_result.adjustments.items():
             if adj_key == 'injury_alpha_boost':
-                if 'injury_alpha' in adjusted:
-                    adjusted['injury_alpha'] *= adj_value
+                signal_name = 'injury_alpha'
             elif adj_key.endswith('_penalty'):
                 signal_name = adj_key.replace('_penalty', '')
-                if signal_name in adjusted:
-                    adjusted[signal_name] *= adj_value
+            else:
+                continue
+            i = self._weight_index.get(signal_name)
+            if i is not None:
+                weights[i] *= adj_value
 
         # Re-normalize weights so they sum to ~1.0
-        total = sum(adjusted.values())
+        total = weights.sum()
         if total > 0:
-            for k in adjusted:
-                adjusted[k] /= total
+            weights /= total
 
-        return adjusted
+        return dict(zip(keys, weights.tolist()))
 
     def record_outcome(
         self,
@@ -227,22 +447,35 @@ class PickQualityFilter:
         profit: float,
     ):
         """Record a bet outcome for ROI tracking."""
-        if stat_type not in self._signal_roi:
-            self._signal_roi[stat_type] = {}
-
-        if signal_name not in self._signal_roi[stat_type]:
-            self._signal_roi[stat_type][signal_name] = SignalROI(
-                signal_name=signal_name,
-                stat_type=stat_type,
-            )
-
-        roi = self._signal_roi[stat_type][signal_name]
-        roi.total_bets += 1
+        row = self._roi_rows.get((stat_type, signal_name))
+        if row is None:
+            row = len(self._roi_rows)
+            if row == len(self._total_bets):
+                self._grow_roi_table()
+            self._roi_rows[(stat_type, signal_name)] = row
+
+        self._total_bets[row] += 1
         if won:
-            roi.wins += 1
-        else:
-            roi.losses += 1
-        roi.total_profit += profit
+            self._wins[row] += 1
+        self._total_profit[row] += profit
+
+        bets = self._total_bets[row]
+        roi = self._total_profit[row] / bets
+        self._roi[row] = roi
+        self._profitable[row] = bets >= MIN_PROFITABLE_BETS and roi > MIN_PROFITABLE_ROI
+
+    def _grow_roi_table(self):
+        """Double the capacity of the ROI arrays."""
+        capacity = 2 * len(self._total_bets)
+        for name in ('_total_bets', '_wins', '_total_profit', '_roi', '_profitable'):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def _roi_stats(self, rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """ROI and profitability flags for the given table rows."""
+        return self._roi[rows], self._profitable[rows]
 
     def _get_signal_roi(
         self,
@@ -250,20 +483,33 @@ class PickQualityFilter:
         stat_type: str,
     ) -> Optional[SignalROI]:
         """Get ROI data for a signal/stat combo."""
-        if stat_type in self._signal_roi:
-            return self._signal_roi[stat_type].get(signal_name)
-        return None
+        row = self._roi_rows.get((stat_type, signal_name))
+        if row is None:
+            return None
+        total_bets = int(self._total_bets[row])
+        wins = int(self._wins[row])
+        return SignalROI(
+            signal_name=signal_name,
+            stat_type=stat_type,
+            total_bets=total_bets,
+            wins=wins,
+            losses=total_bets - wins,
+            total_profit=float(self._total_profit[row]),
+        )
 
     def get_roi_summary(self) -> Dict[str, Dict[str, Dict]]:
         """Get summary of all signal ROI tracking."""
+        n = len(self._roi_rows)
+        bets = self._total_bets[:n]
+        win_rate = (self._wins[:n] / np.maximum(bets, 1)).tolist()
+        roi, profitable = self._roi_stats(np.arange(n))
+
         summary = {}
-        for stat_type, signals in self._signal_roi.items():
-            summary[stat_type] = {}
-            for signal_name, roi in signals.items():
-                summary[stat_type][signal_name] = {
-                    'total_bets': roi.total_bets,
-                    'win_rate': roi.win_rate,
-                    'roi': roi.roi,
-                    'is_profitable': roi.is_profitable,
-                }
+        for (stat_type, signal_name), row in self._roi_rows.items():
+            summary.setdefault(stat_type, {})[signal_name] = {
+                'total_bets': int(bets[row]),
+                'win_rate': win_rate[row],
+                'roi': roi[row].item(),
+                'is_profitable': bool(profitable[row]),
+            }
         return summary
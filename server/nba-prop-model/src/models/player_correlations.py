@@ -7,11 +7,108 @@ Replaces the static default correlation matrix with player-specific
 A pass-first PG has very different PTS/AST correlation than a scoring wing.
 """
 
+from functools import lru_cache
 from typing import Dict, Optional, Tuple
 import numpy as np
 import pandas as pd
 from dataclasses import dataclass
 
+from ..jit import njit, HAS_NUMBA
+
+
+def _frozen_matrix(rows) -> np.ndarray:
+    """Read-only C-contiguous float64 matrix for the shared correlation constants."""
+    matrix = np.ascontiguousarray(rows, dtype=np.float64)
+    matrix.setflags(write=False)
+    return matrix
+
+
+# Position string -> category index into _ARCHETYPE_RULES
+_POSITION_CATEGORY = {
+    'G': 0, 'PG': 0, 'SG': 0, 'GUARD': 0,
+    'F': 1, 'SF': 1, 'PF': 1, 'FORWARD': 1,
+    'C': 2, 'CENTER': 2,
+}
+
+# Per category: (style feature, threshold, (archetype at/below, archetype above)),
+# style features indexed as (ast_per_min, reb_per_min, three_par)
+_ARCHETYPE_RULES = (
+    (0, 0.25, ('scoring_guard', 'pass_first_guard')),
+    (0, 0.20, ('wing_scorer', 'point_forward')),
+    (2, 0.25, ('big_post', 'stretch_big')),
+)
+
+# Unknown positions, indexed by 2 * (ast_per_min > 0.25) + (reb_per_min > 0.30)
+_UNKNOWN_POSITION_ARCHETYPES = ('wing_scorer', 'big_post', 'pass_first_guard', 'pass_first_guard')
+
+
+@lru_cache(maxsize=4096)
+def _classify_archetype_cached(
+    position: str,
+    ast_per_min: float,
+    reb_per_min: float,
+    three_par: float,
+) -> str:
+    """Archetype for a player's position and style (cached; players repeat across slates)"""
+    # Features often arrive as np.float64; plain floats keep the comparisons
+    # below Python bools, which are valid tuple indices
+    ast_per_min, reb_per_min, three_par = float(ast_per_min), float(reb_per_min), float(three_par)
+    category = _POSITION_CATEGORY.get(position.upper() if position else 'G')
+    if category is None:
+        return _UNKNOWN_POSITION_ARCHETYPES[2 * (ast_per_min > 0.25) + (reb_per_min > 0.30)]
+
+    feature, threshold, archetypes = _ARCHETYPE_RULES[category]
+    value = (ast_per_min, reb_per_min, three_par)[feature]
+    return archetypes[value > threshold]
+
+
+@njit('boolean(float64[:, ::1])', cache=True)
+def _is_positive_definite(matrix):
+    """Whether an in-register Cholesky factorization of matrix succeeds."""
+    n = matrix.shape[0]
+    L = np.zeros((n, n))
+    for j in range(n):
+        d = matrix[j, j]
+        for k in range(j):
+            d -= L[j, k] * L[j, k]
+        if not d > 0.0:
+            return False
+        L[j, j] = np.sqrt(d)
+        for i in range(j + 1, n):
+            v = matrix[i, j]
+            for k in range(j):
+                v -= L[i, k] * L[j, k]
+            L[i, j] = v / L[j, j]
+    return True
+
+
+@njit('float64[:, ::1](float64[:, :], boolean)', cache=True)
+def _ensure_valid_correlation_kernel(matrix, skip_symmetrize):
+    """Compiled PlayerCorrelationEstimator._ensure_valid_correlation."""
+    n = matrix.shape[0]
+    out = np.empty((n, n))
+    for i in range(n):
+        for j in range(n):
+            if i == j:
+                out[i, j] = 1.0
+                continue
+            v = matrix[i, j] if skip_symmetrize else (matrix[i, j] + matrix[j, i]) / 2
+            out[i, j] = min(max(v, -1.0), 1.0)
+
+    if _is_positive_definite(out):
+        return out
+
+    eigenvalues, eigenvectors = np.linalg.eigh(out)
+    if eigenvalues[0] < 0:
+        # Nearest correlation matrix via spectral decomposition
+        eigenvalues = np.maximum(eigenvalues, 1e-6)
+        out = (eigenvectors * eigenvalues) @ eigenvectors.T
+        d = np.sqrt(np.diag(out))
+        for i in range(n):
+            for j in range(n):
+                out[i, j] = 1.0 if i == j else out[i, j] / (d[i] * d[j])
+    return out
+
 
 @dataclass
 class PlayerArchetype:
@@ -35,13 +132,18 @@ class PlayerCorrelationEstimator:
     # Minimum games to use partial player data (blend with archetype)
     MIN_GAMES_BLEND = 10
 
+    # Game-log estimates kept per (player_id, n_games) before the oldest is evicted
+    ESTIMATE_CACHE_SIZE = 1024
+
     STAT_COLS = ['PTS', 'REB', 'AST', 'FG3M', 'STL', 'BLK', 'TOV']
+    _STAT_INDEX = {c: i for i, c in enumerate(STAT_COLS)}
+    _STAT_COLS_SET = frozenset(STAT_COLS)
 
     # Archetype correlation matrices (estimated from historical data)
     # These capture typical correlation structures for different player types
 
     # Scoring guard: High PTS-3PM correlation, moderate PTS-AST
-    SCORING_GUARD_CORR = np.array([
+    SCORING_GUARD_CORR = _frozen_matrix([
         #  PTS   REB   AST   3PM   STL   BLK   TOV
         [1.00, 0.10, 0.25, 0.55, 0.12, 0.02, 0.35],  # Points
         [0.10, 1.00, 0.08, 0.03, 0.12, 0.25, 0.03],  # Rebounds
@@ -53,7 +155,7 @@ class PlayerCorrelationEstimator:
     ])
 
     # Pass-first guard: High AST-TOV correlation, high PTS-AST
-    PASS_FIRST_GUARD_CORR = np.array([
+    PASS_FIRST_GUARD_CORR = _frozen_matrix([
         #  PTS   REB   AST   3PM   STL   BLK   TOV
         [1.00, 0.12, 0.45, 0.40, 0.15, 0.03, 0.28],  # Points
         [0.12, 1.00, 0.12, 0.05, 0.15, 0.22, 0.05],  # Rebounds
@@ -65,7 +167,7 @@ class PlayerCorrelationEstimator:
     ])
 
     # Wing scorer: Balanced PTS-REB-AST, moderate 3PM correlation
-    WING_SCORER_CORR = np.array([
+    WING_SCORER_CORR = _frozen_matrix([
         #  PTS   REB   AST   3PM   STL   BLK   TOV
         [1.00, 0.18, 0.30, 0.42, 0.10, 0.05, 0.32],  # Points
         [0.18, 1.00, 0.12, 0.05, 0.15, 0.28, 0.05],  # Rebounds
@@ -77,7 +179,7 @@ class PlayerCorrelationEstimator:
     ])
 
     # Big man (post-centric): High REB-BLK, low PTS-3PM
-    BIG_POST_CORR = np.array([
+    BIG_POST_CORR = _frozen_matrix([
         #  PTS   REB   AST   3PM   STL   BLK   TOV
         [1.00, 0.25, 0.20, 0.10, 0.08, 0.10, 0.25],  # Points
         [0.25, 1.00, 0.10, 0.00, 0.15, 0.35, 0.05],  # Rebounds
@@ -89,7 +191,7 @@ class PlayerCorrelationEstimator:
     ])
 
     # Stretch big: Like big man but with PTS-3PM correlation
-    STRETCH_BIG_CORR = np.array([
+    STRETCH_BIG_CORR = _frozen_matrix([
         #  PTS   REB   AST   3PM   STL   BLK   TOV
         [1.00, 0.20, 0.15, 0.45, 0.08, 0.08, 0.22],  # Points
         [0.20, 1.00, 0.08, 0.03, 0.15, 0.32, 0.05],  # Rebounds
@@ -101,7 +203,7 @@ class PlayerCorrelationEstimator:
     ])
 
     # Point-forward (playmaking big): High AST for size, balanced
-    POINT_FORWARD_CORR = np.array([
+    POINT_FORWARD_CORR = _frozen_matrix([
         #  PTS   REB   AST   3PM   STL   BLK   TOV
         [1.00, 0.20, 0.38, 0.30, 0.12, 0.08, 0.30],  # Points
         [0.20, 1.00, 0.15, 0.05, 0.15, 0.30, 0.08],  # Rebounds
@@ -122,7 +224,7 @@ class PlayerCorrelationEstimator:
     }
 
     # League-wide default (from DistributionModeler)
-    DEFAULT_CORRELATIONS = np.array([
+    DEFAULT_CORRELATIONS = _frozen_matrix([
         [1.00, 0.15, 0.35, 0.45, 0.10, 0.05, 0.30],
         [0.15, 1.00, 0.10, 0.05, 0.15, 0.30, 0.05],
         [0.35, 0.10, 1.00, 0.20, 0.20, 0.05, 0.25],
@@ -132,6 +234,10 @@ class PlayerCorrelationEstimator:
         [0.30, 0.05, 0.25, 0.10, 0.10, 0.05, 1.00],
     ])
 
+    def __init__(self):
+        # (player_id, n_games) -> read-only game-log estimate (or None)
+        self._estimate_cache: Dict[Tuple[int, int], Optional[np.ndarray]] = {}
+
     def get_correlation_matrix(
         self,
         game_log: pd.DataFrame,
@@ -139,6 +245,7 @@ class PlayerCorrelationEstimator:
         ast_per_min: float = 0.0,
         reb_per_min: float = 0.0,
         three_par: float = 0.0,
+        player_id: Optional[int] = None,
     ) -> np.ndarray:
         """
         Get the best available correlation matrix for a player.
@@ -155,6 +262,9 @@ class PlayerCorrelationEstimator:
             ast_per_min: Assists per minute (for archetype detection)
             reb_per_min: Rebounds per minute
             three_par: 3-point attempt rate
+            player_id: Optional player ID; when given, the game-log estimate
+                       is cached per (player_id, games in log), since a
+                       player's log only grows between slates
 
         Returns:
             7x7 correlation matrix
@@ -163,7 +273,7 @@ class PlayerCorrelationEstimator:
 
         # Try player-specific
         if n_games >= self.MIN_GAMES_PLAYER:
-            player_corr = self._estimate_from_game_log(game_log)
+            player_corr = self._cached_estimate(game_log, player_id, n_games)
             if player_corr is not None:
                 return player_corr
 
@@ -173,34 +283,75 @@ class PlayerCorrelationEstimator:
 
         # Blend player data with archetype if we have partial data
         if n_games >= self.MIN_GAMES_BLEND:
-            player_corr = self._estimate_from_game_log(game_log)
+            player_corr = self._cached_estimate(game_log, player_id, n_games)
             if player_corr is not None:
                 blend_weight = (n_games - self.MIN_GAMES_BLEND) / (self.MIN_GAMES_PLAYER - self.MIN_GAMES_BLEND)
                 blend_weight = min(max(blend_weight, 0.0), 1.0)
-                blended = blend_weight * player_corr + (1 - blend_weight) * archetype_corr
-                return self._ensure_valid_correlation(blended)
+                # Blend in place unless player_corr is a shared cached estimate
+                blended = np.multiply(
+                    player_corr, blend_weight,
+                    out=player_corr if player_corr.flags.writeable else None,
+                )
+                blended += (1 - blend_weight) * archetype_corr
+                return self._ensure_valid_correlation(blended, skip_symmetrize=True)
 
         return archetype_corr
 
+    def _cached_estimate(
+        self,
+        game_log: pd.DataFrame,
+        player_id: Optional[int],
+        n_games: int,
+    ) -> Optional[np.ndarray]:
+        """_estimate_from_game_log, memoized per (player_id, n_games) when player_id is known."""
+        if player_id is None:
+            return self._estimate_from_game_log(game_log)
+
+        key = (player_id, n_games)
+        if key in self._estimate_cache:
+            return self._estimate_cache[key]
+
+        player_corr = self._estimate_from_game_log(game_log)
+        if player_corr is not None:
+            player_corr.setflags(write=False)
+        if len(self._estimate_cache) >= self.ESTIMATE_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del self._estimate_cache[next(iter(self._estimate_cache))]
+        self._estimate_cache[key] = player_corr
+        return player_corr
+
     def _estimate_from_game_log(self, game_log: pd.DataFrame) -> Optional[np.ndarray]:
         """Estimate correlation matrix from player's game log."""
-        available_cols = [c for c in self.STAT_COLS if c in game_log.columns]
+        # Common case: the game log carries every stat column
+        has_all_cols = self._STAT_COLS_SET.issubset(game_log.columns)
+        if has_all_cols:
+            available_cols = self.STAT_COLS
+        else:
+            available_cols = [c for c in self.STAT_COLS if c in game_log.columns]
 
         if len(available_cols) < 4:
             return None
 
         # Calculate correlation
         try:
-            corr_df = game_log[available_cols].corr()
+            values = game_log[available_cols].to_numpy(dtype=np.float64)
+            if np.isnan(values).any():
+                # Missing entries: keep pandas' pairwise-complete correlation
+                corr = game_log[available_cols].corr().to_numpy()
+            else:
+                # Constant columns give NaN, which falls back to the default below
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    corr = np.corrcoef(values, rowvar=False)
 
             # Build full 7x7 matrix, filling missing with defaults
-            full_corr = self.DEFAULT_CORRELATIONS.copy()
-            for i, col_i in enumerate(self.STAT_COLS):
-                for j, col_j in enumerate(self.STAT_COLS):
-                    if col_i in corr_df.columns and col_j in corr_df.columns:
-                        val = corr_df.loc[col_i, col_j]
-                        if not np.isnan(val):
-                            full_corr[i, j] = val
+            if has_all_cols:
+                # Already in STAT_COLS order; only NaN entries need defaults
+                full_corr = np.where(np.isnan(corr), self.DEFAULT_CORRELATIONS, corr)
+            else:
+                full_corr = self.DEFAULT_CORRELATIONS.copy()
+                idx = np.array([self._STAT_INDEX[c] for c in available_cols])
+                ii, jj = np.nonzero(~np.isnan(corr))
+                full_corr[idx[ii], idx[jj]] = corr[ii, jj]
 
             return self._ensure_valid_correlation(full_corr)
         except Exception:
@@ -214,56 +365,50 @@ class PlayerCorrelationEstimator:
         three_par: float,
     ) -> str:
         """Classify player into an archetype for correlation lookup."""
+        return _classify_archetype_cached(position, ast_per_min, reb_per_min, three_par)
 
-        position = position.upper() if position else 'G'
-
-        if position in ('G', 'PG', 'SG', 'GUARD'):
-            if ast_per_min > 0.25:
-                return 'pass_first_guard'
-            else:
-                return 'scoring_guard'
-
-        elif position in ('F', 'SF', 'PF', 'FORWARD'):
-            if ast_per_min > 0.20:
-                return 'point_forward'
-            else:
-                return 'wing_scorer'
-
-        elif position in ('C', 'CENTER'):
-            if three_par > 0.25:
-                return 'stretch_big'
-            else:
-                return 'big_post'
+    def _ensure_valid_correlation(
+        self,
+        matrix: np.ndarray,
+        skip_symmetrize: bool = False,
+    ) -> np.ndarray:
+        """
+        Ensure correlation matrix is valid (symmetric, PSD, diag=1).
 
-        # Default
-        if ast_per_min > 0.25:
-            return 'pass_first_guard'
-        elif reb_per_min > 0.30:
-            return 'big_post'
-        else:
-            return 'wing_scorer'
+        Pass skip_symmetrize=True when the input is already symmetric
+        (e.g. a blend of two valid correlation matrices).
+        """
+        if HAS_NUMBA:
+            # The kernel is compiled for writable arrays; class-level matrices
+            # are frozen, so always hand it a writable copy
+            return _ensure_valid_correlation_kernel(
+                np.array(matrix, dtype=np.float64), skip_symmetrize
+            )
 
-    def _ensure_valid_correlation(self, matrix: np.ndarray) -> np.ndarray:
-        """Ensure correlation matrix is valid (symmetric, PSD, diag=1)."""
         # Make symmetric
-        matrix = (matrix + matrix.T) / 2
+        if not skip_symmetrize:
+            matrix = (matrix + matrix.T) / 2
 
-        # Set diagonal to 1
+        # Clip to [-1, 1] and set diagonal to 1
+        matrix = np.clip(matrix, -1.0, 1.0)
         np.fill_diagonal(matrix, 1.0)
 
-        # Clip to [-1, 1]
-        matrix = np.clip(matrix, -1.0, 1.0)
+        # Ensure positive semi-definite. Cholesky succeeds for the common
+        # (positive definite) case; only decompose when it fails.
+        try:
+            np.linalg.cholesky(matrix)
+            return matrix
+        except np.linalg.LinAlgError:
+            pass
 
-        # Ensure positive semi-definite
-        eigvals = np.linalg.eigvalsh(matrix)
-        if np.min(eigvals) < 0:
+        eigenvalues, eigenvectors = np.linalg.eigh(matrix)
+        if eigenvalues[0] < 0:
             # Nearest correlation matrix via spectral decomposition
-            eigenvalues, eigenvectors = np.linalg.eigh(matrix)
             eigenvalues = np.maximum(eigenvalues, 1e-6)
-            matrix = eigenvectors @ np.diag(eigenvalues) @ eigenvectors.T
+            matrix = (eigenvectors * eigenvalues) @ eigenvectors.T
             # Re-normalize
             d = np.sqrt(np.diag(matrix))
-            matrix = matrix / np.outer(d, d)
+            np.divide(matrix, np.outer(d, d), out=matrix)
             np.fill_diagonal(matrix, 1.0)
 
         return matrix
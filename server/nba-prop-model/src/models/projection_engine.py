@@ -2,7 +2,10 @@
 Main Projection Engine
 Combines all sub-models to generate player prop projections
 """
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Mapping, Optional, Tuple
+from functools import lru_cache
+import time
+from types import MappingProxyType
 import pandas as pd
 import numpy as np
 from dataclasses import dataclass
@@ -19,7 +22,9 @@ from src.models.distributions import (
     StatProjection,
     JointProjection,
     calculate_edge,
-    kelly_criterion
+    kelly_criterion,
+    american_to_decimal,
+    american_to_implied
 )
 
 # New model enhancements (v2)
@@ -30,9 +35,65 @@ from src.models.lineup_aware import LineupAwareProjector, LineupContext
 from src.models.ensemble import EnsembleProjector
 from src.models.confidence_calibration import ConfidenceCalibrator
 from src.models.pick_quality_filters import PickQualityFilter
+from src.jit import njit, HAS_NUMBA
 
 
-@dataclass
+@njit('uint8[:](float32[:, :], int64[:], float32[:], uint8[:])', cache=True)
+def _parlay_hits_kernel(sims, cols, lines, sides):
+    """
+    Fused all-legs-hit check, one pass over the simulations.
+
+    sides[j] is 1 for an over (sims > line), 0 for an under (sims < line).
+    """
+    n_sims = sims.shape[0]
+    n_legs = cols.shape[0]
+    out = np.empty(n_sims, dtype=np.uint8)
+    for i in range(n_sims):
+        h = 1
+        for j in range(n_legs):
+            v = sims[i, cols[j]]
+            if sides[j]:
+                h &= v > lines[j]
+            else:
+                h &= v < lines[j]
+        out[i] = h
+    return out
+
+
+# League average fallbacks for regression when career numbers are missing
+LEAGUE_STAT_BASELINES = MappingProxyType({
+    'points': 12.0,
+    'rebounds': 5.0,
+    'assists': 3.0,
+    'threes': 1.5,
+    'steals': 0.8,
+    'blocks': 0.5,
+    'turnovers': 1.5
+})
+
+
+# Projection stat name -> confidence calibrator stat type
+CALIBRATION_STAT_TYPES = MappingProxyType({
+    'points': 'Points', 'rebounds': 'Rebounds', 'assists': 'Assists',
+    'threes': '3-Pointers Made', 'pts_reb_ast': 'Pts+Rebs+Asts',
+})
+
+
+@lru_cache(maxsize=64)
+def _opponent_stats_cached(opponent: str, def_rating: float, pace: float) -> Mapping:
+    """Opponent defensive stats (cached; a slate only faces a handful of teams)"""
+    # In production, this would fetch from database
+    # For now, use provided values + defaults
+    return MappingProxyType({
+        'def_rating': def_rating,
+        'pace': pace,
+        'opp_reb_per_game': 44,  # Would be fetched
+        'opp_ast_per_game': 25,
+        'opp_3pt_pct': 0.36,
+    })
+
+
+@dataclass(slots=True)
 class GameContext:
     """Context for a specific game"""
     opponent: str
@@ -64,7 +125,7 @@ class GameContext:
             self.vs_team_history = []
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PropRecommendation:
     """Betting recommendation for a prop"""
     player_name: str
@@ -90,6 +151,12 @@ class ProjectionEngine:
     """
     Main engine for generating player prop projections
     """
+
+    # Max memoized parlay simulations (10k sims x 11 stats ~ 440 KB each)
+    SIM_CACHE_SIZE = 32
+
+    # Seconds a formatted game date is reused before re-reading the clock
+    DATE_CACHE_SECONDS = 60
     
     def __init__(
         self,
@@ -121,6 +188,23 @@ class ProjectionEngine:
 
         # Cache for opponent stats
         self._opponent_cache: Dict[str, Dict] = {}
+        # (id(projection), n_sims) -> (projection, sims matrix, {stat: column})
+        self._sim_cache: Dict[Tuple[int, int], tuple] = {}
+        # Today's date string and the monotonic time it was formatted
+        self._cached_date: Optional[str] = None
+        self._cached_date_at = 0.0
+
+    def clear_sim_cache(self):
+        """Drop memoized parlay simulations (call after mutating a projection in place)."""
+        self._sim_cache.clear()
+
+    def _today(self) -> str:
+        """Today's date as YYYY-MM-DD, re-formatted at most every DATE_CACHE_SECONDS"""
+        now = time.monotonic()
+        if self._cached_date is None or now - self._cached_date_at > self.DATE_CACHE_SECONDS:
+            self._cached_date = datetime.now().strftime("%Y-%m-%d")
+            self._cached_date_at = now
+        return self._cached_date
         
     def project_player(
         self,
@@ -142,11 +226,10 @@ class ProjectionEngine:
         # Step 2: Get opponent stats and calculate adjustments
         opponent_stats = self._get_opponent_stats(context)
         
-        # Situational Adjustments
-        situational_adjustments = self.situational_engineer.get_situational_adjustments(
+        # Situational Adjustments (cached per home/B2B combination)
+        eff_mult, _ = self.situational_engineer.get_situational_factors(
             is_home=context.is_home,
-            is_b2b=context.is_b2b,
-            rest_days=context.rest_days
+            is_b2b=context.is_b2b
         )
         
         # Matchup Adjustments (with positional defense!)
@@ -158,12 +241,10 @@ class ProjectionEngine:
         
         # Apply situational factors to the matchup adjustments (combine them)
         # Situational usually affects efficiency_mult global, matchup is per stat
-        # We can merge them.
-        eff_mult = situational_adjustments.get('efficiency_mult', 1.0)
-        
-        combined_adjustments = {}
-        for k, v in matchup_adjustments.items():
-            combined_adjustments[k] = v * eff_mult
+        # so scale the per-stat matchup multipliers as one vector.
+        mult_keys = self.stat_model.MATCHUP_MULT_KEYS
+        matchup_mult = np.array([matchup_adjustments.get(key, 1.0) for key in mult_keys])
+        matchup_mult *= eff_mult
             
         # Usage Redistribution (YOUR EDGE!)
         redistribution = self.usage_model.calculate_redistribution(
@@ -172,8 +253,10 @@ class ProjectionEngine:
             team=features.team
         )
 
-        # Merge all modifiers
-        all_modifiers = {**combined_adjustments, **redistribution}
+        # Redistribution multipliers (e.g. threes_mult) take precedence
+        for j, key in enumerate(mult_keys):
+            if key in redistribution:
+                matchup_mult[j] = redistribution[key]
 
         # Step 3: Project minutes (HIGHEST LEVERAGE MODEL)
         # Pass all contextual factors to enhanced minutes model
@@ -191,20 +274,19 @@ class ProjectionEngine:
         # Step 4: Project each stat
         stat_projections = {}
         
-        for stat in ['points', 'rebounds', 'assists', 'threes']:
-            mean, std = self.stat_model.project_stat(
-                stat_name=stat,
-                features=features,
-                minutes=minutes_mean,
-                modifiers=all_modifiers
-            )
-            
-            # Determine distribution type
-            if stat == 'points':
-                dist_type = "normal"
-            else:
-                dist_type = "poisson" if mean < 10 else "negbinom"
-            
+        means, stds = self.stat_model.project_stats(
+            features=features,
+            minutes=minutes_mean,
+            modifiers=redistribution,
+            matchup_mult=matchup_mult
+        )
+        # Points are normal; counting stats are Poisson below 10, else negative binomial
+        dist_types = np.where(means < 10, "poisson", "negbinom")
+        dist_types[0] = "normal"
+
+        for stat, mean, std, dist_type in zip(
+            self.stat_model.PROJECTED_STATS, means.tolist(), stds.tolist(), dist_types.tolist()
+        ):
             stat_projections[stat] = StatProjection(
                 stat_name=stat,
                 mean=max(mean, 0),
@@ -234,11 +316,12 @@ class ProjectionEngine:
             ast_per_min=features.ast_per_min,
             reb_per_min=features.reb_per_min,
             three_par=features.three_par,
+            player_id=features.player_id or None,
         )
 
         # Step 6: Create joint projection
         player_name = game_log['PLAYER_NAME'].iloc[0] if 'PLAYER_NAME' in game_log else "Unknown"
-        game_date = datetime.now().strftime("%Y-%m-%d")
+        game_date = self._today()
         
         return self.distribution_modeler.create_joint_projection(
             stat_projections=stat_projections,
@@ -300,17 +383,7 @@ class ProjectionEngine:
         elif stat_name == 'assists' and features.career_apg:
             return features.career_apg
         
-        # League average fallbacks
-        league_avgs = {
-            'points': 12.0,
-            'rebounds': 5.0,
-            'assists': 3.0,
-            'threes': 1.5,
-            'steals': 0.8,
-            'blocks': 0.5,
-            'turnovers': 1.5
-        }
-        return league_avgs.get(stat_name, 5.0)
+        return LEAGUE_STAT_BASELINES.get(stat_name, 5.0)
     
     def _estimate_stat_std(
         self,
@@ -344,17 +417,11 @@ class ProjectionEngine:
         
         return max(actual_std, mean * cv * 0.5)
     
-    def _get_opponent_stats(self, context: GameContext) -> Dict:
-        """Get opponent defensive stats"""
-        # In production, this would fetch from database
-        # For now, use provided values + defaults
-        return {
-            'def_rating': context.opponent_def_rating,
-            'pace': context.opponent_pace,
-            'opp_reb_per_game': 44,  # Would be fetched
-            'opp_ast_per_game': 25,
-            'opp_3pt_pct': 0.36,
-        }
+    def _get_opponent_stats(self, context: GameContext) -> Mapping:
+        """Get opponent defensive stats (read-only, shared across calls)"""
+        return _opponent_stats_cached(
+            context.opponent, context.opponent_def_rating, context.opponent_pace
+        )
     
     def evaluate_prop(
         self,
@@ -383,11 +450,7 @@ class ProjectionEngine:
         prob_under = 1 - prob_over
 
         # Apply confidence calibration (v2 enhancement)
-        stat_type_map = {
-            'points': 'Points', 'rebounds': 'Rebounds', 'assists': 'Assists',
-            'threes': '3-Pointers Made', 'pts_reb_ast': 'Pts+Rebs+Asts',
-        }
-        cal_stat_type = stat_type_map.get(stat, stat)
+        cal_stat_type = CALIBRATION_STAT_TYPES.get(stat, stat)
         cal_result = self.confidence_calibrator.calibrate(prob_over, cal_stat_type)
         prob_over = cal_result.calibrated_probability
         prob_under = 1 - prob_over
@@ -416,11 +479,8 @@ class ProjectionEngine:
         else:
             confidence = "no_bet"
         
-        # Implied probability
-        if odds < 0:
-            implied = abs(odds) / (abs(odds) + 100)
-        else:
-            implied = 100 / (odds + 100)
+        # Implied probability (cached per price)
+        implied = american_to_implied(odds)
         
         return PropRecommendation(
             player_name=projection.player_name,
@@ -449,21 +509,113 @@ class ProjectionEngine:
             available_lines: Dict of stat -> list of (line, odds) tuples
             top_n: Number of top recommendations to return
         """
-        recommendations = []
-        
+        # Gather (stat, line, odds, calibrated P(over)) across every line,
+        # one survival-function call per stat
+        stats, line_parts, odds_parts, prob_parts = [], [], [], []
         for stat, lines in available_lines.items():
-            for line, odds in lines:
-                try:
-                    rec = self.evaluate_prop(projection, stat, line, odds)
-                    if rec.edge >= self.min_edge_threshold:
-                        recommendations.append(rec)
-                except Exception:
-                    continue
-        
-        # Sort by edge
-        recommendations.sort(key=lambda x: x.edge, reverse=True)
-        
-        return recommendations[:top_n]
+            stat_proj = getattr(projection, stat, None)
+            if not isinstance(stat_proj, StatProjection) or not lines:
+                continue
+            line_arr = np.array([line for line, _ in lines], dtype=np.float64)
+            prob_parts.append(self.confidence_calibrator.calibrate_many(
+                stat_proj.prob_over_vec(line_arr),
+                CALIBRATION_STAT_TYPES.get(stat, stat)
+            ))
+            line_parts.append(line_arr)
+            odds_parts.append(np.array([odds for _, odds in lines], dtype=np.int64))
+            stats.extend([stat] * len(lines))
+        
+        if not stats:
+            return []
+        
+        line_arr = np.concatenate(line_parts)
+        odds_arr = np.concatenate(odds_parts)
+        prob_over = np.concatenate(prob_parts)
+        prob_under = 1 - prob_over
+        
+        # Best side per line; ties go to the under as in evaluate_prop
+        is_over = prob_over > prob_under
+        model_prob = np.where(is_over, prob_over, prob_under)
+        
+        # Implied probability and payout from a lookup table over the distinct
+        # prices (a slate only quotes a few), then edge and EV as calculate_edge
+        prices, price_idx = np.unique(odds_arr, return_inverse=True)
+        prices = prices.tolist()
+        implied = np.array([american_to_implied(o) for o in prices])[price_idx]
+        profit_if_win = np.array([american_to_decimal(o) - 1 for o in prices])[price_idx]
+        edge = model_prob - implied
+        ev = model_prob * profit_if_win - (1 - model_prob)
+        
+        keep = np.flatnonzero(edge >= self.min_edge_threshold)
+        if len(keep) == 0:
+            return []
+        
+        # Top-n by edge: partition to the n-th best edge, then a stable sort of
+        # everything at or above it keeps the original order among ties
+        kept_edges = edge[keep]
+        if len(keep) > top_n > 0:
+            kth = np.partition(kept_edges, len(keep) - top_n)[len(keep) - top_n]
+            keep = keep[kept_edges >= kth]
+            kept_edges = edge[keep]
+        keep = keep[np.argsort(-kept_edges, kind='stable')][:top_n]
+        
+        # Kelly sizing (same math as kelly_criterion)
+        edge = edge[keep]
+        b = profit_if_win[keep]
+        p = implied[keep] + edge
+        kelly = np.where(edge > 0, (b * p - (1 - p)) / b * self.kelly_fraction, 0.0)
+        kelly = np.minimum(np.maximum(kelly, 0), 0.05)
+        
+        confidence = np.select(
+            [edge >= 0.08, edge >= 0.05, edge >= self.min_edge_threshold],
+            ["high", "medium", "low"],
+            default="no_bet"
+        )
+        
+        return [
+            PropRecommendation(
+                player_name=projection.player_name,
+                stat=stats[i],
+                line=float(line_arr[i]),
+                side="over" if is_over[i] else "under",
+                model_prob=float(model_prob[i]),
+                implied_prob=float(implied[i]),
+                edge=float(e),
+                expected_value=float(ev[i]),
+                kelly_bet=float(k),
+                confidence=str(c)
+            )
+            for i, e, k, c in zip(keep.tolist(), edge.tolist(), kelly.tolist(), confidence.tolist())
+        ]
+    
+    def _simulated_outcomes(
+        self,
+        projection: JointProjection,
+        n_sims: int
+    ) -> Tuple[np.ndarray, Dict[str, int]]:
+        """
+        Joint simulations for a projection, memoized per (projection, n_sims)
+        
+        Returns:
+            (n_sims, n_stats) float32 matrix and a stat -> column map
+        """
+        key = (id(projection), n_sims)
+        cached = self._sim_cache.get(key)
+        # The stored projection guards against a recycled id()
+        if cached is not None and cached[0] is projection:
+            return cached[1], cached[2]
+        
+        sims = self.distribution_modeler._simulate_joint_arrays(projection, n_sims)
+        col_idx = {stat: j for j, stat in enumerate(sims)}
+        matrix = np.empty((len(sims['points']), len(col_idx)), dtype=np.float32)
+        for stat, j in col_idx.items():
+            matrix[:, j] = sims[stat]
+        
+        if len(self._sim_cache) >= self.SIM_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del self._sim_cache[next(iter(self._sim_cache))]
+        self._sim_cache[key] = (projection, matrix, col_idx)
+        return matrix, col_idx
     
     def evaluate_parlay(
         self,
@@ -479,18 +631,31 @@ class ProjectionEngine:
             legs: List of (stat, line, side) tuples
             n_sims: Number of simulations
         """
-        # Simulate outcomes
-        sims = self.distribution_modeler.simulate_joint_outcomes(projection, n_sims)
-        
-        # Check each simulation
-        hits = np.ones(n_sims, dtype=bool)
+        # Simulate outcomes (memoized per projection)
+        matrix, col_idx = self._simulated_outcomes(projection, n_sims)
         
+        # Resolve each leg to a sims column, line and over/under flag
+        cols, lines, sides = [], [], []
         for stat, line, side in legs:
-            if stat in sims.columns:
-                if side.lower() == "over":
-                    hits &= (sims[stat] > line)
-                else:
-                    hits &= (sims[stat] < line)
+            if stat in col_idx:
+                cols.append(col_idx[stat])
+                lines.append(line)
+                sides.append(side.lower() == "over")
+        
+        cols = np.array(cols, dtype=np.int64)
+        lines = np.array(lines, dtype=np.float32)
+        sides = np.array(sides, dtype=np.uint8)
+        
+        # Check each simulation
+        if HAS_NUMBA:
+            hits = _parlay_hits_kernel(matrix, cols, lines, sides)
+        else:
+            # One comparison row per leg, then a single AND down the legs
+            cmp = np.empty((len(cols), len(matrix)), dtype=bool)
+            for j, col in enumerate(cols):
+                compare = np.greater if sides[j] else np.less
+                compare(matrix[:, col], lines[j], out=cmp[j])
+            hits = np.logical_and.reduce(cmp, axis=0)
         
         prob = hits.mean()
         
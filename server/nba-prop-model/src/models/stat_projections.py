@@ -66,3 +66,52 @@ class StatProjectionModel:
         std_proj = mean_proj * hist_cv
         
         return mean_proj, std_proj
+
+    # Stats covered by project_stats, in output order
+    PROJECTED_STATS = ('points', 'rebounds', 'assists', 'threes')
+
+    # Matchup multiplier key per PROJECTED_STATS entry
+    MATCHUP_MULT_KEYS = tuple(f'{stat}_mult' for stat in PROJECTED_STATS)
+
+    def project_stats(
+        self,
+        features: PlayerFeatures,
+        minutes: float,
+        modifiers: Dict[str, float],
+        matchup_mult: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Project all PROJECTED_STATS at once (Means, Stds)
+
+        Same formulas as project_stat, evaluated over a (4,) stat vector.
+        When matchup_mult is given it replaces the '<stat>_mult' entries
+        of modifiers (one multiplier per PROJECTED_STATS entry).
+        """
+        usage_boost = modifiers.get('usage_boost', 1.0)
+        pts_career_rate = features.career_ppg / 36.0 if features.career_ppg else features.pts_per_min
+
+        # 1. Base rates (per minute) with their boosts
+        rates = np.array([
+            (0.5 * features.pts_per_min + 0.3 * features.pts_per_min_l5 + 0.2 * pts_career_rate) * usage_boost,
+            features.reb_per_min * modifiers.get('rebound_boost', 1.0),
+            features.ast_per_min * modifiers.get('assist_boost', 1.0),
+            features.three_pm_per_min * usage_boost,
+        ])
+
+        # 2-3. Matchup modifiers and means
+        if matchup_mult is None:
+            matchup_mult = np.array([modifiers.get(key, 1.0) for key in self.MATCHUP_MULT_KEYS])
+        means = rates * minutes * matchup_mult
+
+        # 4. Historical CV for points/rebounds (0.4 default for the rest),
+        # clamped to [0.2, 0.6]; a NaN CV (missing std/rate features) goes to
+        # the lower bound, as max(0.2, min(cv, 0.6)) does in project_stat
+        cv = np.array([0.3, 0.4, 0.4, 0.4])
+        if features.minutes_season > 0:
+            hist_std = np.array([features.pts_std, features.reb_std])
+            expected = np.array([features.pts_per_min, features.reb_per_min]) * features.minutes_season
+            np.divide(hist_std, expected, out=cv[:2], where=expected > 0)
+        np.nan_to_num(cv, copy=False, nan=0.2)
+        np.clip(cv, 0.2, 0.6, out=cv)
+
+        return means, means * cv
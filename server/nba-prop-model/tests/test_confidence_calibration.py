@@ -0,0 +1,29 @@
+"""Checks for the optional scikit-learn dependency of confidence calibration."""
+import importlib
+import sys
+
+import numpy as np
+
+import src.models.confidence_calibration as confidence_calibration
+
+
+def test_platt_scaling_falls_back_without_sklearn(monkeypatch):
+    # A None entry in sys.modules makes the import raise ImportError
+    monkeypatch.setitem(sys.modules, "sklearn", None)
+    monkeypatch.setitem(sys.modules, "sklearn.linear_model", None)
+    module = importlib.reload(confidence_calibration)
+    try:
+        assert not module.HAS_SKLEARN
+
+        rng = np.random.default_rng(0)
+        probs = rng.uniform(0.05, 0.95, 300)
+        outcomes = (rng.random(300) < probs).astype(float)
+        calibrator = module.ConfidenceCalibrator()
+        calibrator.fit_platt_scaling(probs, outcomes, "Points")
+
+        a, b = calibrator._platt_params["Points"]
+        assert np.isfinite(a) and np.isfinite(b)
+        assert 0.0 < calibrator.calibrate(0.6, "Points").calibrated_probability < 1.0
+    finally:
+        monkeypatch.undo()
+        importlib.reload(confidence_calibration)
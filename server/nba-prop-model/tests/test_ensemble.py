@@ -0,0 +1,54 @@
+"""Regression checks for the gradient-boosted model's numba kernels."""
+import numpy as np
+import pytest
+
+from src.models import ensemble
+from src.models.ensemble import SimpleGradientBoostedModel
+
+
+@pytest.fixture
+def fitted_model():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(200, 4))
+    y = 2.0 * X[:, 0] - X[:, 2] + rng.normal(scale=0.1, size=200)
+    model = SimpleGradientBoostedModel(n_estimators=20)
+    model.fit(X, y)
+    return model
+
+
+def _rows_with_nan():
+    X = np.random.default_rng(1).normal(size=(16, 4)).astype(np.float32)
+    X[0, :] = np.nan
+    X[3, 0] = np.nan
+    X[7, 2] = np.nan
+    return X
+
+
+def test_predict_kernel_matches_numpy_path(fitted_model, monkeypatch):
+    X = _rows_with_nan()
+
+    monkeypatch.setattr(ensemble, "HAS_NUMBA", True)
+    kernel = fitted_model.predict(X)
+    monkeypatch.setattr(ensemble, "HAS_NUMBA", False)
+    reference = fitted_model.predict(X)
+
+    np.testing.assert_allclose(kernel, reference, rtol=1e-5, atol=1e-5)
+
+
+def test_apply_stump_kernel_matches_numpy_path(monkeypatch):
+    X = _rows_with_nan()
+    y = np.linspace(-1.0, 1.0, X.shape[0], dtype=np.float32)
+    model = SimpleGradientBoostedModel()
+    stump = {'feature_idx': 0, 'threshold': 0.1, 'left_value': 1.5, 'right_value': -2.0}
+
+    results = []
+    for has_numba in (True, False):
+        monkeypatch.setattr(ensemble, "HAS_NUMBA", has_numba)
+        predictions = np.full(X.shape[0], 0.5, dtype=np.float32)
+        residuals = np.empty_like(predictions)
+        model._apply_stump(X, y, stump, predictions, residuals, np.empty_like(predictions))
+        results.append((predictions, residuals))
+
+    (kernel_pred, kernel_res), (ref_pred, ref_res) = results
+    np.testing.assert_allclose(kernel_pred, ref_pred, rtol=1e-6)
+    np.testing.assert_allclose(kernel_res, ref_res, rtol=1e-6)
@@ -0,0 +1,37 @@
+"""Regression checks for player correlation archetypes."""
+import numpy as np
+import pytest
+
+from src.models.player_correlations import (
+    PlayerCorrelationEstimator,
+    _classify_archetype_cached,
+)
+
+
+@pytest.mark.parametrize(
+    "position, ast, reb, three_par, expected",
+    [
+        ("PG", 0.30, 0.10, 0.30, "pass_first_guard"),
+        ("SG", 0.10, 0.10, 0.30, "scoring_guard"),
+        ("SF", 0.25, 0.20, 0.30, "point_forward"),
+        ("PF", 0.10, 0.20, 0.30, "wing_scorer"),
+        ("C", 0.10, 0.40, 0.30, "stretch_big"),
+        ("C", 0.10, 0.40, 0.10, "big_post"),
+        ("G-F", 0.30, 0.40, 0.10, "pass_first_guard"),
+        ("G-F", 0.10, 0.40, 0.10, "big_post"),
+        ("G-F", 0.10, 0.10, 0.10, "wing_scorer"),
+    ],
+)
+def test_classify_archetype_accepts_numpy_floats(position, ast, reb, three_par, expected):
+    # Engineered features are np.float64; comparisons must not index with numpy.bool
+    args = (np.float64(ast), np.float64(reb), np.float64(three_par))
+    assert _classify_archetype_cached(position, *args) == expected
+    assert _classify_archetype_cached(position, ast, reb, three_par) == expected
+
+
+def test_ensure_valid_correlation_accepts_frozen_matrix():
+    frozen = PlayerCorrelationEstimator.DEFAULT_CORRELATIONS
+    assert not frozen.flags.writeable
+    result = PlayerCorrelationEstimator()._ensure_valid_correlation(frozen)
+    np.testing.assert_allclose(np.diag(result), 1.0)
+    np.testing.assert_allclose(result, result.T)